@@ -7,8 +7,9 @@ Controls the Windows Notepad application.
 import logging
 import time
 import subprocess
-import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
+
+_LOGGER = logging.getLogger("summer.apps.notepad")
 
 try:
     import pyautogui
@@ -16,6 +17,27 @@ try:
 except ImportError:
     PYAUTOGUI_AVAILABLE = False
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import pyperclip
+    PYPERCLIP_AVAILABLE = True
+except ImportError:
+    PYPERCLIP_AVAILABLE = False
+
+# How long the result of a system-wide "is it running" check is reused (seconds)
+RUNNING_CACHE_TTL = 0.5
+
+# Shorter text is typed directly, longer text is pasted from the clipboard
+MIN_PASTE_LENGTH = 8
+
+# How long Notepad gets to read a paste before the clipboard is restored (seconds)
+PASTE_SETTLE_TIME = 0.1
+
 class NotepadController:
     """
     Controller for the Windows Notepad application.
@@ -32,17 +54,29 @@ class NotepadController:
         Args:
             config: Configuration dictionary for the controller
         """
-        self.logger = logging.getLogger("summer.apps.notepad")
+        self.logger = _LOGGER
         self.config = config or {}
         
         # Check if pyautogui is available
         if not PYAUTOGUI_AVAILABLE:
             self.logger.warning("pyautogui library not found. Some features may be limited.")
+        else:
+            # Drop pyautogui's default 0.1s pause after every call
+            pyautogui.PAUSE = self.config.get("pyautogui_pause", 0.0)
+            pyautogui.MINIMUM_DURATION = 0
+            pyautogui.MINIMUM_SLEEP = 0
         
         # App-specific configuration
         self.app_path = self.config.get("app_path", "notepad.exe")
         self.window_title = "Untitled - Notepad"
         self.process = None
+        self.window_timeout = self.config.get("window_timeout", 2.0)
+        
+        # Cached window handle, looked up on first use
+        self._window = None
+        
+        # Last result of the system-wide running check and when it was made
+        self._running_cache = (False, 0.0)
         
         self.logger.info("Notepad controller initialized")
     
@@ -56,16 +90,16 @@ class NotepadController:
         self.logger.info("Opening Notepad")
         
         try:
-            # Make sure the path is correct for notepad.exe
-            if not os.path.exists(self.app_path):
-                # Try the default location if the configured path doesn't exist
-                self.app_path = "notepad.exe"
+            # Windows already open belong to other instances, not the one launched here
+            existing = self._window_handles()
             
-            # Launch Notepad as a subprocess with shell=True to ensure it works
-            self.process = subprocess.Popen(self.app_path, shell=True)
+            # Launch Notepad directly; the executable is resolved via PATH
+            self.process = subprocess.Popen([self.app_path])
+            self._running_cache = (True, time.monotonic())
             
-            # Wait for the window to appear
-            time.sleep(1.0)
+            # Wait for the new window to appear
+            self._window = None
+            self._wait_for_window(self.window_timeout, existing)
             
             return {
                 "success": True,
@@ -106,10 +140,18 @@ class NotepadController:
                     time.sleep(0.5)
                     # If a dialog appears, press "Don't Save"
                     pyautogui.press('n')
+                elif PSUTIL_AVAILABLE:
+                    # Terminate any running instance directly
+                    for proc in self._find_processes():
+                        proc.terminate()
                 else:
                     # As a last resort, use taskkill
                     subprocess.run(["taskkill", "/f", "/im", "notepad.exe"])
             
+            # The window is gone, drop the cached handle and running state
+            self._window = None
+            self._running_cache = (False, 0.0)
+            
             return {
                 "success": True,
                 "message": "Notepad closed successfully"
@@ -132,7 +174,7 @@ class NotepadController:
         Returns:
             A dictionary containing the result of the operation
         """
-        self.logger.info(f"Writing text in Notepad: {text}")
+        self.logger.info("Writing text in Notepad: %s", text)
         
         if not PYAUTOGUI_AVAILABLE:
             return {
@@ -149,12 +191,14 @@ class NotepadController:
             # Focus on Notepad window
             self._focus_window()
             
-            # Select all existing text (Ctrl+A) and delete it
-            pyautogui.hotkey('ctrl', 'a')
-            pyautogui.press('delete')
+            # Clear existing text
+            self._clear_document()
             
-            # Type the new text
-            pyautogui.write(text)
+            # Paste the new text in one go, or type it if it is short
+            if PYPERCLIP_AVAILABLE and len(text) >= MIN_PASTE_LENGTH:
+                self._paste(text)
+            else:
+                pyautogui.write(text)
             
             return {
                 "success": True,
@@ -175,13 +219,73 @@ class NotepadController:
         Returns:
             True if Notepad is running, False otherwise
         """
-        # A simple check by looking for the process
+        # Fast path: the process we launched ourselves is still alive
+        if self.process is not None and self.process.poll() is None:
+            return True
+        
+        # Otherwise look for any running instance, reusing a recent answer
+        running, checked_at = self._running_cache
+        now = time.monotonic()
+        if now - checked_at < RUNNING_CACHE_TTL:
+            return running
+        
+        running = self._probe_running()
+        self._running_cache = (running, now)
+        return running
+    
+    def _probe_running(self) -> bool:
+        """
+        Look for any running Notepad process.
+        
+        Returns:
+            True if Notepad is running, False otherwise
+        """
         try:
+            if PSUTIL_AVAILABLE:
+                return any(self._find_processes())
             output = subprocess.check_output(["tasklist", "/fi", "imagename eq notepad.exe"])
             return b"notepad.exe" in output
         except:
             return False
     
+    def _find_processes(self):
+        """
+        Find running Notepad processes using psutil.
+        
+        Returns:
+            An iterator over the matching psutil.Process objects
+        """
+        for proc in psutil.process_iter(["name"]):
+            proc_name = proc.info["name"]
+            if proc_name and proc_name.lower() == "notepad.exe":
+                yield proc
+    
+    def _clear_document(self) -> None:
+        """Select all existing text in Notepad and delete it."""
+        # Send Ctrl+A and Delete as one burst of key events
+        pyautogui.keyDown('ctrl')
+        try:
+            pyautogui.press('a')
+        finally:
+            # Never leave Ctrl held down system-wide, e.g. after a FailSafeException
+            pyautogui.keyUp('ctrl')
+        pyautogui.press('delete')
+    
+    def _paste(self, text: str) -> None:
+        """
+        Paste text through the clipboard, keeping the user's clipboard contents.
+        
+        Args:
+            text: The text to paste
+        """
+        previous = pyperclip.paste()
+        pyperclip.copy(text)
+        try:
+            pyautogui.hotkey('ctrl', 'v')
+            time.sleep(PASTE_SETTLE_TIME)  # Let Notepad read the clipboard before restoring it
+        finally:
+            pyperclip.copy(previous)
+    
     def _focus_window(self) -> bool:
         """
         Focus on the Notepad window.
@@ -193,12 +297,83 @@ class NotepadController:
             return False
         
         try:
-            # Try to find and focus on a window with "Notepad" in the title
+            window = self._get_window()
+            if window is None:
+                return False
+            
+            try:
+                # Nothing to do if the window is already in the foreground
+                if window.isActive:
+                    return True
+                window.activate()
+            except Exception:
+                # The cached handle went stale, look the window up again
+                self._window = None
+                window = self._get_window()
+                if window is None:
+                    return False
+                window.activate()
+            
+            time.sleep(0.2)  # Give it a moment to come to the foreground
+            return True
+        except:
+            return False
+    
+    def _window_handles(self) -> Set[int]:
+        """
+        Get the handles of the Notepad windows that are currently open.
+        
+        Returns:
+            The window handles, or an empty set if they can't be listed
+        """
+        if not PYAUTOGUI_AVAILABLE:
+            return set()
+        
+        try:
+            return {window._hWnd for window in pyautogui.getWindowsWithTitle("Notepad")}
+        except Exception:
+            return set()
+    
+    def _wait_for_window(self, timeout: float, existing: Set[int]) -> bool:
+        """
+        Wait until a new Notepad window appears, and cache it.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            existing: Handles of the windows open before the launch, which are skipped
+        
+        Returns:
+            True if the window was found, False on timeout
+        """
+        if not PYAUTOGUI_AVAILABLE:
+            return False
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                for window in pyautogui.getWindowsWithTitle("Notepad"):
+                    if window._hWnd not in existing:
+                        self._window = window
+                        return True
+            except Exception:
+                pass
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+    
+    def _get_window(self):
+        """
+        Get the Notepad window, reusing the cached handle when available.
+        
+        Returns:
+            The window object, or None if no Notepad window was found
+        """
+        if self._window is None:
+            # Try to find a window with "Notepad" in the title
             windows = pyautogui.getWindowsWithTitle("Notepad")
             if windows:
-                windows[0].activate()
-                time.sleep(0.2)  # Give it a moment to come to the foreground
-                return True
-            return False
-        except:
-            return False
\ No newline at end of file
+                self._window = windows[0]
+        return self._window
+
+# Controller class picked up by the command processor
+CONTROLLER_CLASS = NotepadController
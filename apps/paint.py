@@ -4,11 +4,13 @@ Summer AI Assistant - Paint Controller
 Controls the Windows Paint application.
 """
 
+import functools
 import logging
 import time
 import subprocess
-import os
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Set, Tuple
+
+_LOGGER = logging.getLogger("summer.apps.paint")
 
 try:
     import pyautogui
@@ -16,6 +18,86 @@ try:
 except ImportError:
     PYAUTOGUI_AVAILABLE = False
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# How long the result of a system-wide "is it running" check is reused (seconds)
+RUNNING_CACHE_TTL = 0.5
+
+# Relative (x, y) location of a shape's center on the canvas for each position
+POSITION_OFFSETS = {
+    "center": (0.5, 0.5),
+    "top": (0.5, 0.25),
+    "bottom": (0.5, 0.75),
+    "left": (0.25, 0.5),
+    "right": (0.75, 0.5),
+    "top-left": (0.25, 0.25),
+    "top-right": (0.75, 0.25),
+    "bottom-left": (0.25, 0.75),
+    "bottom-right": (0.75, 0.75)
+}
+
+@functools.lru_cache(maxsize=32)
+def _canvas_from_rect(left: int, top: int, width: int, height: int) -> Tuple[int, int, int, int]:
+    """
+    Estimate the canvas area (excluding toolbars and menus) from the window rectangle.
+    
+    These offsets are approximate and may need adjustment.
+    
+    Args:
+        left: The window's left coordinate
+        top: The window's top coordinate
+        width: The window's width
+        height: The window's height
+    
+    Returns:
+        A tuple containing (left, top, right, bottom) coordinates
+    """
+    return (
+        left + 10,
+        top + 100,  # Account for title bar, menu, toolbars
+        left + width - 10,
+        top + height - 10
+    )
+
+@functools.lru_cache(maxsize=128)
+def _calculate_shape_coordinates(canvas_coords: Tuple[int, int, int, int],
+                                 shape: str,
+                                 position: str) -> Tuple[int, int, int, int]:
+    """
+    Calculate the drag coordinates for drawing a shape on the canvas.
+    
+    The result only depends on the arguments, so it is cached.
+    
+    Args:
+        canvas_coords: The (left, top, right, bottom) coordinates of the canvas
+        shape: The lowercase shape name
+        position: The lowercase position name (e.g., "center", "top-left")
+    
+    Returns:
+        A tuple containing (start_x, start_y, end_x, end_y) coordinates
+    """
+    left, top, right, bottom = canvas_coords
+    width = right - left
+    height = bottom - top
+    
+    # Locate the center of the shape, defaulting to the canvas center
+    offset_x, offset_y = POSITION_OFFSETS.get(position.replace(" ", "-"), POSITION_OFFSETS["center"])
+    center_x = left + int(width * offset_x)
+    center_y = top + int(height * offset_y)
+    
+    # Size the shape relative to the canvas
+    half_height = min(width, height) // 8
+    half_width = half_height * 3 // 2 if shape == "rectangle" else half_height
+    
+    if shape == "line":
+        return (center_x - half_width, center_y, center_x + half_width, center_y)
+    
+    return (center_x - half_width, center_y - half_height, center_x + half_width, center_y + half_height)
+
 class PaintController:
     """
     Controller for the Windows Paint application.
@@ -33,17 +115,29 @@ class PaintController:
         Args:
             config: Configuration dictionary for the controller
         """
-        self.logger = logging.getLogger("summer.apps.paint")
+        self.logger = _LOGGER
         self.config = config or {}
         
         # Check if pyautogui is available
         if not PYAUTOGUI_AVAILABLE:
             self.logger.warning("pyautogui library not found. Some features may be limited.")
+        else:
+            # Drop pyautogui's default 0.1s pause after every call
+            pyautogui.PAUSE = self.config.get("pyautogui_pause", 0.0)
+            pyautogui.MINIMUM_DURATION = 0
+            pyautogui.MINIMUM_SLEEP = 0
         
         # App-specific configuration
         self.app_path = self.config.get("app_path", "mspaint.exe")
         self.window_title = "Untitled - Paint"
         self.process = None
+        self.window_timeout = self.config.get("window_timeout", 2.0)
+        
+        # Cached window handle, looked up on first use
+        self._window = None
+        
+        # Last result of the system-wide running check and when it was made
+        self._running_cache = (False, 0.0)
         
         # Define positions for various Paint controls (may need adjustment based on resolution)
         self.tools = {
@@ -57,6 +151,15 @@ class PaintController:
             "line": {'key': 'l'}
         }
         
+        # Map every supported shape name directly to its tool key
+        self._shape_key = {
+            "square": self.tools["rectangle"]["key"],
+            "rectangle": self.tools["rectangle"]["key"],
+            "circle": self.tools["circle"]["key"],
+            "oval": self.tools["circle"]["key"],
+            "line": self.tools["line"]["key"]
+        }
+        
         self.logger.info("Paint controller initialized")
     
     def open(self) -> Dict[str, Any]:
@@ -69,16 +172,16 @@ class PaintController:
         self.logger.info("Opening Paint")
         
         try:
-            # Make sure the path is correct for mspaint.exe
-            if not os.path.exists(self.app_path):
-                # Try the default location if the configured path doesn't exist
-                self.app_path = "mspaint.exe"
+            # Windows already open belong to other instances, not the one launched here
+            existing = self._window_handles()
             
-            # Launch Paint as a subprocess
-            self.process = subprocess.Popen(self.app_path, shell=True)
+            # Launch Paint directly; the executable is resolved via PATH
+            self.process = subprocess.Popen([self.app_path])
+            self._running_cache = (True, time.monotonic())
             
-            # Wait for the window to appear
-            time.sleep(2.0)
+            # Wait for the new window to appear
+            self._window = None
+            self._wait_for_window(self.window_timeout, existing)
             
             return {
                 "success": True,
@@ -119,10 +222,18 @@ class PaintController:
                     time.sleep(0.5)
                     # If a dialog appears, press "Don't Save"
                     pyautogui.press('n')
+                elif PSUTIL_AVAILABLE:
+                    # Terminate any running instance directly
+                    for proc in self._find_processes():
+                        proc.terminate()
                 else:
                     # As a last resort, use taskkill
                     subprocess.run(["taskkill", "/f", "/im", "mspaint.exe"])
             
+            # The window is gone, drop the cached handle and running state
+            self._window = None
+            self._running_cache = (False, 0.0)
+            
             return {
                 "success": True,
                 "message": "Paint closed successfully"
@@ -146,7 +257,7 @@ class PaintController:
         Returns:
             A dictionary containing the result of the operation
         """
-        self.logger.info(f"Drawing {shape} in Paint at {position}")
+        self.logger.info("Drawing %s in Paint at %s", shape, position)
         
         if not PYAUTOGUI_AVAILABLE:
             return {
@@ -163,21 +274,12 @@ class PaintController:
             # Focus on Paint window
             self._focus_window()
             
-            # Clear existing content (Ctrl+A to select all, then delete)
-            pyautogui.hotkey('ctrl', 'a')
-            pyautogui.press('delete')
+            # Clear existing content
+            self._clear_canvas()
             
-            # Select the appropriate tool
-            tool_key = None
-            if shape.lower() in ["square", "rectangle"]:
-                tool_key = self.tools["rectangle"]["key"]
-            elif shape.lower() in ["circle", "oval"]:
-                tool_key = self.tools["circle"]["key"]
-            elif shape.lower() == "line":
-                tool_key = self.tools["line"]["key"]
-            else:
-                # Default to pencil for other shapes
-                tool_key = self.tools["pencil"]["key"]
+            # Select the appropriate tool, defaulting to pencil for other shapes
+            shape_name = shape.lower()
+            tool_key = self._shape_key.get(shape_name, self.tools["pencil"]["key"])
             
             # Select the tool
             pyautogui.press(tool_key)
@@ -186,15 +288,13 @@ class PaintController:
             canvas_coords = self._get_canvas_coordinates()
             
             # Calculate drawing coordinates based on position
-            start_x, start_y, end_x, end_y = self._calculate_shape_coordinates(
-                canvas_coords, shape, position
+            start_x, start_y, end_x, end_y = _calculate_shape_coordinates(
+                canvas_coords, shape_name, position.lower()
             )
             
-            # Draw the shape
+            # Draw the shape with a single drag from start to end
             pyautogui.moveTo(start_x, start_y)
-            pyautogui.mouseDown()
-            pyautogui.moveTo(end_x, end_y)
-            pyautogui.mouseUp()
+            pyautogui.dragTo(end_x, end_y, duration=0, button='left')
             
             return {
                 "success": True,
@@ -215,13 +315,58 @@ class PaintController:
         Returns:
             True if Paint is running, False otherwise
         """
-        # A simple check by looking for the process
+        # Fast path: the process we launched ourselves is still alive
+        if self.process is not None and self.process.poll() is None:
+            return True
+        
+        # Otherwise look for any running instance, reusing a recent answer
+        running, checked_at = self._running_cache
+        now = time.monotonic()
+        if now - checked_at < RUNNING_CACHE_TTL:
+            return running
+        
+        running = self._probe_running()
+        self._running_cache = (running, now)
+        return running
+    
+    def _probe_running(self) -> bool:
+        """
+        Look for any running Paint process.
+        
+        Returns:
+            True if Paint is running, False otherwise
+        """
         try:
+            if PSUTIL_AVAILABLE:
+                return any(self._find_processes())
             output = subprocess.check_output(["tasklist", "/fi", "imagename eq mspaint.exe"])
             return b"mspaint.exe" in output
         except:
             return False
     
+    def _find_processes(self):
+        """
+        Find running Paint processes using psutil.
+        
+        Returns:
+            An iterator over the matching psutil.Process objects
+        """
+        for proc in psutil.process_iter(["name"]):
+            proc_name = proc.info["name"]
+            if proc_name and proc_name.lower() == "mspaint.exe":
+                yield proc
+    
+    def _clear_canvas(self) -> None:
+        """Select the whole Paint canvas and delete it."""
+        # Send Ctrl+A and Delete as one burst of key events
+        pyautogui.keyDown('ctrl')
+        try:
+            pyautogui.press('a')
+        finally:
+            # Never leave Ctrl held down system-wide, e.g. after a FailSafeException
+            pyautogui.keyUp('ctrl')
+        pyautogui.press('delete')
+    
     def _focus_window(self) -> bool:
         """
         Focus on the Paint window.
@@ -233,16 +378,84 @@ class PaintController:
             return False
         
         try:
-            # Try to find and focus on a window with "Paint" in the title
-            windows = pyautogui.getWindowsWithTitle("Paint")
-            if windows:
-                windows[0].activate()
-                time.sleep(0.2)  # Give it a moment to come to the foreground
-                return True
-            return False
+            window = self._get_window()
+            if window is None:
+                return False
+            
+            try:
+                # Nothing to do if the window is already in the foreground
+                if window.isActive:
+                    return True
+                window.activate()
+            except Exception:
+                # The cached handle went stale, look the window up again
+                self._window = None
+                window = self._get_window()
+                if window is None:
+                    return False
+                window.activate()
+            
+            time.sleep(0.2)  # Give it a moment to come to the foreground
+            return True
         except:
             return False
     
+    def _window_handles(self) -> Set[int]:
+        """
+        Get the handles of the Paint windows that are currently open.
+        
+        Returns:
+            The window handles, or an empty set if they can't be listed
+        """
+        if not PYAUTOGUI_AVAILABLE:
+            return set()
+        
+        try:
+            return {window._hWnd for window in pyautogui.getWindowsWithTitle("Paint")}
+        except Exception:
+            return set()
+    
+    def _wait_for_window(self, timeout: float, existing: Set[int]) -> bool:
+        """
+        Wait until a new Paint window appears, and cache it.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            existing: Handles of the windows open before the launch, which are skipped
+        
+        Returns:
+            True if the window was found, False on timeout
+        """
+        if not PYAUTOGUI_AVAILABLE:
+            return False
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                for window in pyautogui.getWindowsWithTitle("Paint"):
+                    if window._hWnd not in existing:
+                        self._window = window
+                        return True
+            except Exception:
+                pass
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+    
+    def _get_window(self):
+        """
+        Get the Paint window, reusing the cached handle when available.
+        
+        Returns:
+            The window object, or None if no Paint window was found
+        """
+        if self._window is None:
+            # Try to find a window with "Paint" in the title
+            windows = pyautogui.getWindowsWithTitle("Paint")
+            if windows:
+                self._window = windows[0]
+        return self._window
+    
     def _get_canvas_coordinates(self) -> Tuple[int, int, int, int]:
         """
         Get the coordinates of the Paint canvas area.
@@ -256,23 +469,18 @@ class PaintController:
         
         try:
             # Get the window
-            windows = pyautogui.getWindowsWithTitle("Paint")
-            if not windows:
+            window = self._get_window()
+            if window is None:
                 return (0, 0, 0, 0)
             
-            window = windows[0]
-            
-            # Get window position and size
-            left, top, width, height = window.left, window.top, window.width, window.height
+            # Read the window position and size in a single query
+            left, top, width, height = window.box
             
-            # Estimate the canvas area (excluding toolbars and menus)
-            # These offsets are approximate and may need adjustment
-            canvas_left = left + 10
-            canvas_top = top + 100  # Account for title bar, menu, toolbars
-            canvas_right = left + width - 10
-            canvas_bottom = top + height - 10
-            
-            return (canvas_left, canvas_top, canvas_right, canvas_bottom)
+            return _canvas_from_rect(left, top, width, height)
         except:
             # Return full screen dimensions as a fallback
-            screen_width, screen_height = pyautogui.size()
\ No newline at end of file
+            screen_width, screen_height = pyautogui.size()
+            return (0, 0, screen_width, screen_height)
+
+# Controller class picked up by the command processor
+CONTROLLER_CLASS = PaintController
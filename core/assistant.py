@@ -4,21 +4,27 @@ Summer AI Assistant - Core Assistant Class
 The main coordinator for the Summer AI assistant, orchestrating all components.
 """
 
+import concurrent.futures
 import logging
+import queue
 import time
 from typing import Dict, Any, Optional
 
+from core.config import SummerConfig
 from core.listener import Listener
+from core.context import Context
 from core.command_processor import CommandProcessor
 from core.response_generator import ResponseGenerator
 from core.tts_engine import TTSEngine
+from core.http_client import create_http_client
+from core.nlp_engine import NLPEngine as BasicNLPEngine, match_fast_path
 
 # Try to import the advanced LangChain NLP engine, fall back to basic if not available
 try:
     from core.langchain_nlp_engine import LangChainNLPEngine as NLPEngine
     USING_LANGCHAIN = True
 except ImportError:
-    from core.nlp_engine import NLPEngine
+    NLPEngine = BasicNLPEngine
     USING_LANGCHAIN = False
 
 class Assistant:
@@ -36,52 +42,112 @@ class Assistant:
         
         # Store configuration
         self.config = config or {}
+        self.settings = SummerConfig.from_dict(self.config)
         
-        # Initialize components
-        self.listener = Listener(self.config.get("listener", {}))
-        
-        # Initialize NLP engine (LangChain or basic)
-        try:
-            self.nlp_engine = NLPEngine(self.config.get("nlp", {}))
-            self.logger.info(f"Using {'LangChain' if USING_LANGCHAIN else 'Basic'} NLP engine")
-        except Exception as e:
-            self.logger.error(f"Error initializing NLP engine: {e}")
-            self.logger.info("Falling back to basic NLP engine")
-            from core.nlp_engine import NLPEngine as BasicNLPEngine
-            self.nlp_engine = BasicNLPEngine(self.config.get("nlp", {}))
-        
-        self.command_processor = CommandProcessor(self.config.get("command", {}))
-        self.response_generator = ResponseGenerator(self.config.get("response", {}))
-        
-        # Initialize TTS engine
-        self.tts_engine = TTSEngine(self.config.get("tts", {}))
+        # Components are created on first use (see the properties below)
+        self._http_client = None
+        self._listener = None
+        self._nlp_engine = None
+        self._command_processor = None
+        self._response_generator = None
+        self._tts_engine = None
         
         # State management
         self.is_running = False
         self.is_listening = False
-        self.current_context = {}
+        self.current_context = Context()
+        
+        # Last processed command and when it was processed, to drop repeats
+        self._last_cmd = ("", 0.0)
+        self.duplicate_window = self.settings.duplicate_window
+        
+        # Recognized commands are pushed here by the listener thread
+        self._command_queue = queue.Queue()
+        
+        # Responses are spoken on a single worker so playback doesn't block
+        self._tts_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="summer-tts"
+        )
+        self._tts_future = None
         
         self.logger.info("Summer Assistant initialized")
     
+    @property
+    def http_client(self):
+        """The HTTP client shared by the OpenAI-based components, created on first use."""
+        if self._http_client is None:
+            self._http_client = create_http_client()
+        return self._http_client
+    
+    @property
+    def listener(self) -> Listener:
+        """The speech listener, created on first use."""
+        if self._listener is None:
+            self._listener = Listener(self.config.get("listener", {}))
+        return self._listener
+    
+    @property
+    def nlp_engine(self):
+        """The NLP engine (LangChain or basic), created on first use."""
+        if self._nlp_engine is None:
+            try:
+                if USING_LANGCHAIN:
+                    self._nlp_engine = NLPEngine(self.config.get("nlp", {}), http_client=self.http_client)
+                else:
+                    self._nlp_engine = NLPEngine(self.config.get("nlp", {}))
+                self.logger.info(f"Using {'LangChain' if USING_LANGCHAIN else 'Basic'} NLP engine")
+            except Exception as e:
+                self.logger.error(f"Error initializing NLP engine: {e}")
+                self.logger.info("Falling back to basic NLP engine")
+                self._nlp_engine = BasicNLPEngine(self.config.get("nlp", {}))
+        return self._nlp_engine
+    
+    @property
+    def command_processor(self) -> CommandProcessor:
+        """The command processor, created on first use."""
+        if self._command_processor is None:
+            self._command_processor = CommandProcessor(self.config.get("command", {}))
+        return self._command_processor
+    
+    @property
+    def response_generator(self) -> ResponseGenerator:
+        """The response generator, created on first use."""
+        if self._response_generator is None:
+            self._response_generator = ResponseGenerator(self.config.get("response", {}))
+        return self._response_generator
+    
+    @property
+    def tts_engine(self) -> TTSEngine:
+        """The TTS engine, created on first use."""
+        if self._tts_engine is None:
+            self._tts_engine = TTSEngine(self.config.get("tts", {}), http_client=self.http_client)
+        return self._tts_engine
+    
     def start(self):
         """Start the assistant and begin listening for commands."""
         self.logger.info("Starting assistant")
         self.is_running = True
         self.is_listening = True
         
+        # Listen on a background thread and block on the queue of commands
+        self.listener.start_background(self._command_queue)
+        
         # Main loop
         while self.is_running:
             try:
-                # Listen for command
-                if self.is_listening:
-                    self.logger.info("Listening for command...")
-                    command_text = self.listener.listen()
-                    
-                    if command_text:
-                        self.process_command(command_text)
-                
-                # Small sleep to prevent CPU overuse
-                time.sleep(0.1)
+                # The timeout only exists so is_running is rechecked periodically
+                command_text = self._command_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            
+            # The listener stopped because its input was closed, nothing more will arrive
+            if command_text is None:
+                break
+            
+            try:
+                if command_text:
+                    self.process_command(command_text)
             except Exception as e:
                 self.logger.error(f"Error in main loop: {e}")
                 # Continue running despite errors
@@ -95,18 +161,34 @@ class Assistant:
         Args:
             command_text: The raw text of the command to process
         """
-        self.logger.info(f"Processing command: {command_text}")
+        command_text = command_text.strip()
+        if not command_text:
+            return
+        
+        # Speech recognizers may emit the same utterance twice in a row
+        now = time.monotonic()
+        last_text, last_ts = self._last_cmd
+        if command_text == last_text and now - last_ts < self.duplicate_window:
+            self.logger.info("Ignoring duplicate command: %s", command_text)
+            return
+        self._last_cmd = (command_text, now)
+        
+        self.logger.info("Processing command: %s", command_text)
         
         try:
-            # Use NLP to understand the command
-            intent_data = self.nlp_engine.process(command_text, self.current_context)
-            self.logger.debug(f"Intent recognized: {intent_data}")
+            # Canonical commands are executed right away, without the NLP engine
+            intent_data = match_fast_path(command_text)
+            if intent_data is None:
+                # Use NLP to understand the command
+                intent_data = self.nlp_engine.process(command_text, self.current_context.as_dict())
+            
+            self.logger.debug("Intent recognized: %s", intent_data)
             
             # Process the command based on the recognized intent
             result = self.command_processor.execute(intent_data, self.current_context)
             
             # Update context with the new information
-            self.current_context.update(result.get("context_update", {}))
+            self.current_context.apply(result.get("context_update", {}))
             
             # Generate response
             response = self.response_generator.generate(
@@ -117,25 +199,61 @@ class Assistant:
             
             # Output the response (both displayed and spoken)
             if response:
-                self.logger.info(f"Response: {response}")
+                self.logger.info("Response: %s", response)
                 print(f"Summer: {response}")
                 
-                # Speak the response if TTS is enabled
-                self.tts_engine.speak(response)
+                # Speak the response in the background if TTS is enabled
+                self._speak_async(response)
         
         except Exception as e:
             self.logger.error(f"Error processing command: {e}")
             error_response = self.response_generator.generate_error(str(e))
             print(f"Summer: {error_response}")
     
+    def _speak_async(self, text: str):
+        """
+        Queue a response to be spoken on the TTS worker thread.
+        
+        Args:
+            text: The response text to speak
+        """
+        # A response that hasn't started playing yet is stale, drop it
+        if self._tts_future is not None:
+            self._tts_future.cancel()
+        
+        # Stop listening while speaking so the microphone doesn't pick up the reply
+        if self._listener is not None:
+            self._listener.pause()
+        
+        self._tts_future = self._tts_pool.submit(self.tts_engine.speak, text)
+        self._tts_future.add_done_callback(self._on_speech_done)
+    
+    def _on_speech_done(self, future: concurrent.futures.Future):
+        """
+        Resume listening once the latest response has finished playing.
+        
+        Args:
+            future: The finished (or cancelled) TTS future
+        """
+        # A newer response is still queued or playing, keep the listener paused
+        if future is not self._tts_future:
+            return
+        
+        if self.is_listening and self._listener is not None:
+            self._listener.resume()
+    
     def stop_listening(self):
         """Pause listening for commands."""
         self.is_listening = False
+        if self._listener is not None:
+            self._listener.pause()
         self.logger.info("Listening paused")
     
     def resume_listening(self):
         """Resume listening for commands."""
         self.is_listening = True
+        if self._listener is not None:
+            self._listener.resume()
         self.logger.info("Listening resumed")
     
     def shutdown(self):
@@ -144,11 +262,19 @@ class Assistant:
         self.is_running = False
         self.is_listening = False
         
-        # Clean up resources
-        self.listener.shutdown()
-        self.nlp_engine.shutdown()
-        self.command_processor.shutdown()
-        self.response_generator.shutdown()
-        self.tts_engine.shutdown()
+        # Stop speaking; a response still waiting to play is dropped
+        if self._tts_future is not None:
+            self._tts_future.cancel()
+        self._tts_pool.shutdown(wait=False)
+        
+        # Clean up resources, skipping components that were never created
+        for component in (self._listener, self._nlp_engine, self._command_processor,
+                          self._response_generator, self._tts_engine):
+            if component is not None:
+                component.shutdown()
+        
+        # Close the shared connections once no component uses them
+        if self._http_client is not None:
+            self._http_client.close()
         
         self.logger.info("Assistant shutdown complete")
\ No newline at end of file
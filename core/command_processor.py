@@ -6,9 +6,97 @@ Executes recognized intents by routing them to the appropriate handlers.
 
 import logging
 import importlib
+import importlib.metadata
 import os
+import string
+import sys
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Callable, List, Tuple
 
+from core.context import Context
+
+# Controller classes discovered in the apps directory, keyed by module name.
+# Shared by all CommandProcessor instances so the directory is scanned only once.
+_CONTROLLER_CACHE: Dict[str, type] = {}
+_APPS_SCANNED = False
+
+# Map common variations of application names to standard names
+APP_NAME_MAPPING = MappingProxyType({
+    "notepad": "notepad",
+    "note": "notepad",
+    "notes": "notepad",
+    "texteditor": "notepad",
+
+    "paint": "paint",
+    "mspaint": "paint",
+    "drawing": "paint",
+
+    "calc": "calculator",
+    "calculator": "calculator",
+
+    "browser": "browser",
+    "chrome": "browser",
+    "edge": "browser",
+    "firefox": "browser",
+    "web": "browser",
+
+    "system": "system",
+    "windows": "system",
+    "computer": "system"
+})
+
+# Translation table that lowercases ASCII letters and strips whitespace in one pass
+_NORMALIZE_TABLE = str.maketrans(
+    {**{c: c.lower() for c in string.ascii_uppercase}, " ": None, "\t": None, "\n": None}
+)
+
+# Entry point group that installed packages can use to register extra controllers
+CONTROLLER_ENTRY_POINT_GROUP = "summer.controllers"
+_ENTRY_POINTS_CACHE: Optional[Tuple[Any, ...]] = None
+
+def controller_entry_points() -> Tuple[Any, ...]:
+    """
+    Get the controller entry points registered by installed packages.
+    
+    The metadata is only queried once; later calls return the cached tuple.
+    
+    Returns:
+        A tuple of importlib.metadata.EntryPoint objects
+    """
+    global _ENTRY_POINTS_CACHE
+    
+    if _ENTRY_POINTS_CACHE is None:
+        try:
+            entry_points = importlib.metadata.entry_points()
+            if hasattr(entry_points, "select"):
+                found = entry_points.select(group=CONTROLLER_ENTRY_POINT_GROUP)
+            else:
+                # Python < 3.10 returns a dict of groups
+                found = entry_points.get(CONTROLLER_ENTRY_POINT_GROUP, [])
+            _ENTRY_POINTS_CACHE = tuple(found)
+        except Exception:
+            _ENTRY_POINTS_CACHE = ()
+    
+    return _ENTRY_POINTS_CACHE
+
+def cached_import(module_path: str):
+    """
+    Import a module, taking it straight from sys.modules when already loaded.
+    
+    Args:
+        module_path: Dotted path of the module to import
+    
+    Returns:
+        The imported module
+    """
+    module = sys.modules.get(module_path)
+    if module is None:
+        module = importlib.import_module(module_path)
+    return module
+
+# Shared, read-only result returned by every placeholder operation
+_PLACEHOLDER_SUCCESS = MappingProxyType({"success": True})
+
 # Placeholder controller for testing
 class PlaceholderController:
     """Temporary placeholder for app controllers during development."""
@@ -18,20 +106,20 @@ class PlaceholderController:
         self.logger = logging.getLogger(f"summer.placeholder.{app_name}")
     
     def open(self):
-        self.logger.info(f"[PLACEHOLDER] Opening {self.app_name}")
-        return {"success": True}
+        self.logger.info("[PLACEHOLDER] Opening %s", self.app_name)
+        return _PLACEHOLDER_SUCCESS
     
     def close(self):
-        self.logger.info(f"[PLACEHOLDER] Closing {self.app_name}")
-        return {"success": True}
+        self.logger.info("[PLACEHOLDER] Closing %s", self.app_name)
+        return _PLACEHOLDER_SUCCESS
     
     def write_text(self, text):
-        self.logger.info(f"[PLACEHOLDER] Writing in {self.app_name}: {text}")
-        return {"success": True}
+        self.logger.info("[PLACEHOLDER] Writing in %s: %s", self.app_name, text)
+        return _PLACEHOLDER_SUCCESS
     
     def draw_shape(self, shape, position=None):
-        self.logger.info(f"[PLACEHOLDER] Drawing {shape} in {self.app_name} at {position}")
-        return {"success": True}
+        self.logger.info("[PLACEHOLDER] Drawing %s in %s at %s", shape, self.app_name, position)
+        return _PLACEHOLDER_SUCCESS
 
 class CommandProcessor:
     """
@@ -41,6 +129,9 @@ class CommandProcessor:
     to the appropriate controller based on the intent.
     """
     
+    # Fixed attribute layout, avoiding a per-instance __dict__
+    __slots__ = ("logger", "config", "app_controllers", "intent_handlers", "_method_cache")
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the command processor with the specified configuration.
@@ -57,6 +148,9 @@ class CommandProcessor:
         # Dictionary to map intents to handlers
         self.intent_handlers = {}
         
+        # Bound controller methods, keyed by (controller id, method name)
+        self._method_cache: Dict[Tuple[int, str], Callable] = {}
+        
         # Register built-in intent handlers
         self._register_built_in_handlers()
         
@@ -68,7 +162,7 @@ class CommandProcessor:
     def _register_built_in_handlers(self):
         """Register the built-in intent handlers."""
         # Map intents to methods within this class
-        self.intent_handlers = {
+        handlers = {
             "open_application": self._handle_open_application,
             "close_application": self._handle_close_application,
             "write_text": self._handle_write_text,
@@ -77,44 +171,31 @@ class CommandProcessor:
             "unknown": self._handle_unknown_intent,
             # Add more handlers as needed
         }
+        
+        # Intern the intent names once here rather than on every execute()
+        self.intent_handlers = {sys.intern(intent): handler for intent, handler in handlers.items()}
     
     def _load_app_controllers(self):
         """
         Load all available application controllers.
         
         This method dynamically loads controller classes from the apps directory.
+        The discovered classes are cached, so only the first instance scans it.
         """
-        try:
-            # Get the apps directory
-            apps_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "apps")
-            
-            # Import all Python files in the apps directory
-            for filename in os.listdir(apps_dir):
-                if filename.endswith(".py") and not filename.startswith("__"):
-                    module_name = filename[:-3]  # Remove .py extension
-                    
-                    try:
-                        # Import the module
-                        module = importlib.import_module(f"apps.{module_name}")
-                        
-                        # Look for a class that matches the module name (CamelCase)
-                        controller_class_name = "".join(word.capitalize() for word in module_name.split("_")) + "Controller"
-                        
-                        if hasattr(module, controller_class_name):
-                            # Create an instance of the controller
-                            controller_class = getattr(module, controller_class_name)
-                            controller = controller_class(self.config.get(module_name, {}))
-                            
-                            # Store the controller
-                            self.app_controllers[module_name] = controller
-                            self.logger.info(f"Loaded controller for {module_name}")
-                    
-                    except Exception as e:
-                        self.logger.error(f"Error loading controller {module_name}: {e}")
+        if not _APPS_SCANNED:
+            self._discover_controller_classes()
+        
+        # Create an instance of each discovered controller
+        for module_name, controller_class in _CONTROLLER_CACHE.items():
+            try:
+                controller = controller_class(self.config.get(module_name, {}))
+                
+                # Store the controller
+                self.app_controllers[module_name] = controller
+                self.logger.info("Loaded controller for %s", module_name)
+            except Exception as e:
+                self.logger.error("Error loading controller %s: %s", module_name, e)
         
-        except Exception as e:
-            self.logger.error(f"Error loading app controllers: {e}")
-            
         # Add controllers for apps that might not be dynamically loaded
         if "paint" not in self.app_controllers:
             try:
@@ -123,7 +204,7 @@ class CommandProcessor:
                 self.app_controllers["paint"] = PaintController(self.config.get("paint", {}))
                 self.logger.info("Manually loaded controller for paint")
             except Exception as e:
-                self.logger.error(f"Error loading Paint controller: {e}")
+                self.logger.error("Error loading Paint controller: %s", e)
                 self.app_controllers["paint"] = PlaceholderController("paint")
                 
         if "notepad" not in self.app_controllers:
@@ -133,55 +214,99 @@ class CommandProcessor:
                 self.app_controllers["notepad"] = NotepadController(self.config.get("notepad", {}))
                 self.logger.info("Manually loaded controller for notepad")
             except Exception as e:
-                self.logger.error(f"Error loading Notepad controller: {e}")
+                self.logger.error("Error loading Notepad controller: %s", e)
                 self.app_controllers["notepad"] = PlaceholderController("notepad")
         
         # For any controllers we still don't have, use placeholders
         for app in ["calculator", "browser", "system"]:
             if app not in self.app_controllers:
                 self.app_controllers[app] = PlaceholderController(app)
-                self.logger.warning(f"Using placeholder controller for {app}")
+                self.logger.warning("Using placeholder controller for %s", app)
+    
+    def _discover_controller_classes(self):
+        """
+        Find controller classes and cache them for all instances.
+        
+        Controllers come from the modules in the apps directory and from the
+        "summer.controllers" entry point group of installed packages.
+        """
+        global _APPS_SCANNED
+        
+        try:
+            # Get the apps directory
+            apps_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "apps")
+            
+            # Import all Python files in the apps directory
+            for filename in os.listdir(apps_dir):
+                if filename.endswith(".py") and not filename.startswith("__"):
+                    module_name = filename[:-3]  # Remove .py extension
+                    
+                    try:
+                        # Import the module
+                        module = cached_import(f"apps.{module_name}")
+                        
+                        # Each app module names its controller in CONTROLLER_CLASS
+                        controller_class = getattr(module, "CONTROLLER_CLASS", None)
+                        if controller_class is not None:
+                            _CONTROLLER_CACHE[module_name] = controller_class
+                    
+                    except Exception as e:
+                        self.logger.error("Error loading controller %s: %s", module_name, e)
+            
+            _APPS_SCANNED = True
+        
+        except Exception as e:
+            self.logger.error("Error loading app controllers: %s", e)
+        
+        # Add controllers registered by installed packages
+        for entry_point in controller_entry_points():
+            if entry_point.name in _CONTROLLER_CACHE:
+                continue
+            try:
+                _CONTROLLER_CACHE[entry_point.name] = entry_point.load()
+            except Exception as e:
+                self.logger.error("Error loading controller %s: %s", entry_point.name, e)
     
-    def execute(self, intent_data: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def execute(self, intent_data: Dict[str, Any], context: Optional[Context] = None) -> Dict[str, Any]:
         """
         Execute a command based on the recognized intent.
         
         Args:
             intent_data: Dictionary containing intent and parameters
-            context: Optional context information
+            context: Optional conversation context
         
         Returns:
             A dictionary containing the result of the execution
         """
-        context = context or {}
+        if context is None:
+            context = Context()
         
         intent = intent_data.get("intent", "unknown")
         parameters = intent_data.get("parameters", {})
         
-        self.logger.info(f"Executing intent: {intent} with parameters: {parameters}")
+        self.logger.info("Executing intent: %s with parameters: %s", intent, parameters)
         
         # Look up the handler for this intent
         handler = self.intent_handlers.get(intent)
         
-        if handler:
-            try:
-                # Call the handler with the parameters and context
-                result = handler(parameters, context)
-                return result
-            except Exception as e:
-                self.logger.error(f"Error executing intent {intent}: {e}")
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "message": f"Failed to execute {intent}"
-                }
-        else:
-            self.logger.warning(f"No handler found for intent: {intent}")
+        if handler is None:
+            self.logger.warning("No handler found for intent: %s", intent)
             return {
                 "success": False,
                 "error": "Unknown intent",
                 "message": f"I don't know how to handle {intent}"
             }
+        
+        try:
+            # Call the handler with the parameters and context
+            return handler(parameters, context)
+        except Exception as e:
+            self.logger.error("Error executing intent %s: %s", intent, e)
+            return {
+                "success": False,
+                "error": str(e),
+                "message": f"Failed to execute {intent}"
+            }
     
     def _get_app_controller(self, app_name: str):
         """
@@ -193,43 +318,30 @@ class CommandProcessor:
         Returns:
             The controller object, or None if not found
         """
-        # Normalize the app name (remove spaces, lowercase)
-        normalized_name = app_name.lower().replace(" ", "")
-        
-        # Map common variations to standard names
-        app_name_mapping = {
-            "notepad": "notepad",
-            "note": "notepad",
-            "notes": "notepad",
-            "texteditor": "notepad",
-            
-            "paint": "paint",
-            "mspaint": "paint",
-            "drawing": "paint",
-            
-            "calc": "calculator",
-            "calculator": "calculator",
-            
-            "browser": "browser",
-            "chrome": "browser",
-            "edge": "browser",
-            "firefox": "browser",
-            "web": "browser",
-            
-            "system": "system",
-            "windows": "system",
-            "computer": "system",
-        }
+        # Normalize the app name (remove whitespace, lowercase)
+        normalized_name = app_name.translate(_NORMALIZE_TABLE)
+        
+        # Map common variations to the standard name, or use the name directly
+        return self.app_controllers.get(APP_NAME_MAPPING.get(normalized_name, normalized_name))
+    
+    def _controller_method(self, controller: Any, method_name: str) -> Callable:
+        """
+        Get a bound method of a controller, resolving it only once.
         
-        # Try to map the normalized name to a standard name
-        standard_name = app_name_mapping.get(normalized_name)
-        if standard_name:
-            return self.app_controllers.get(standard_name)
+        Args:
+            controller: The application controller
+            method_name: The name of the method (e.g., "open", "draw_shape")
         
-        # If no mapping found, try direct lookup
-        return self.app_controllers.get(normalized_name)
+        Returns:
+            The bound method
+        """
+        key = (id(controller), method_name)
+        method = self._method_cache.get(key)
+        if method is None:
+            method = self._method_cache[key] = getattr(controller, method_name)
+        return method
     
-    def _handle_greeting(self, parameters: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_greeting(self, parameters: Dict[str, Any], context: Context) -> Dict[str, Any]:
         """Handle greeting intents."""
         return {
             "success": True,
@@ -239,7 +351,7 @@ class CommandProcessor:
             }
         }
     
-    def _handle_draw_shape(self, parameters: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_draw_shape(self, parameters: Dict[str, Any], context: Context) -> Dict[str, Any]:
         """Handle the draw_shape intent."""
         shape = parameters.get("shape", "")
         app_name = parameters.get("app_name", "")
@@ -254,7 +366,7 @@ class CommandProcessor:
         
         if not app_name:
             # If no app specified, try to use the active app
-            app_name = context.get("active_app")
+            app_name = context.active_app
             if not app_name:
                 return {
                     "success": False,
@@ -266,7 +378,7 @@ class CommandProcessor:
         
         if controller:
             try:
-                result = controller.draw_shape(shape, position)
+                result = self._controller_method(controller, "draw_shape")(shape, position)
                 return {
                     "success": True,
                     "message": f"Drew {shape} in {app_name}",
@@ -289,7 +401,7 @@ class CommandProcessor:
                 "message": f"I don't know how to draw in {app_name}"
             }
     
-    def _handle_unknown_intent(self, parameters: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_unknown_intent(self, parameters: Dict[str, Any], context: Context) -> Dict[str, Any]:
         """Handle unknown intents."""
         return {
             "success": False,
@@ -299,7 +411,7 @@ class CommandProcessor:
     
     # Intent handlers
     
-    def _handle_open_application(self, parameters: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_open_application(self, parameters: Dict[str, Any], context: Context) -> Dict[str, Any]:
         """
         Handle the open_application intent.
         
@@ -325,7 +437,7 @@ class CommandProcessor:
         if controller:
             try:
                 # Call the open method on the controller
-                result = controller.open()
+                result = self._controller_method(controller, "open")()
                 
                 # Update context
                 return {
@@ -337,7 +449,7 @@ class CommandProcessor:
                     }
                 }
             except Exception as e:
-                self.logger.error(f"Error opening {app_name}: {e}")
+                self.logger.error("Error opening %s: %s", app_name, e)
                 return {
                     "success": False,
                     "error": str(e),
@@ -350,13 +462,13 @@ class CommandProcessor:
                 "message": f"I don't know how to open {app_name}"
             }
     
-    def _handle_close_application(self, parameters: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_close_application(self, parameters: Dict[str, Any], context: Context) -> Dict[str, Any]:
         """Handle the close_application intent."""
         app_name = parameters.get("app_name", "")
         
         if not app_name:
             # If no app specified, try to close the active app
-            app_name = context.get("active_app")
+            app_name = context.active_app
             if not app_name:
                 return {
                     "success": False,
@@ -368,7 +480,7 @@ class CommandProcessor:
         
         if controller:
             try:
-                result = controller.close()
+                result = self._controller_method(controller, "close")()
                 return {
                     "success": True,
                     "message": f"Closed {app_name}",
@@ -390,7 +502,7 @@ class CommandProcessor:
                 "message": f"I don't know how to close {app_name}"
             }
     
-    def _handle_write_text(self, parameters: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_write_text(self, parameters: Dict[str, Any], context: Context) -> Dict[str, Any]:
         """Handle the write_text intent."""
         content = parameters.get("content", "")
         app_name = parameters.get("app_name", "")
@@ -404,7 +516,7 @@ class CommandProcessor:
         
         if not app_name:
             # If no app specified, try to use the active app
-            app_name = context.get("active_app")
+            app_name = context.active_app
             if not app_name:
                 return {
                     "success": False,
@@ -416,7 +528,7 @@ class CommandProcessor:
         
         if controller:
             try:
-                result = controller.write_text(content)
+                result = self._controller_method(controller, "write_text")(content)
                 return {
                     "success": True,
                     "message": f"Wrote text in {app_name}",
@@ -437,4 +549,9 @@ class CommandProcessor:
                 "success": False,
                 "error": "Unknown application",
                 "message": f"I don't know how to write in {app_name}"
-            }
\ No newline at end of file
+            }
+    
+    def shutdown(self):
+        """Release resources and shutdown the command processor."""
+        self.logger.info("Shutting down command processor")
+        # Application controllers hold no resources that need releasing
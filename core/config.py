@@ -0,0 +1,35 @@
+"""
+Summer AI Assistant - Configuration
+---------------------------------
+Typed access to the general settings in config.yml.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Dict, Any
+
+@dataclass(slots=True)
+class SummerConfig:
+    """
+    Settings from the "assistant" section of the configuration.
+    
+    The other sections are passed to their components as dictionaries.
+    """
+    
+    name: str = "Summer"
+    version: str = "0.1.0"
+    debug: bool = False
+    duplicate_window: float = 1.5
+    
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "SummerConfig":
+        """
+        Read the settings from a loaded configuration.
+        
+        Args:
+            config: The full configuration dictionary
+        
+        Returns:
+            The settings, with defaults for any that are missing
+        """
+        section = config.get("assistant") or {}
+        return cls(**{field.name: section[field.name] for field in fields(cls) if field.name in section})
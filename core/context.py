@@ -0,0 +1,46 @@
+"""
+Summer AI Assistant - Conversation Context
+----------------------------------------
+Holds the state that carries over from one command to the next.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Optional
+
+@dataclass(slots=True)
+class Context:
+    """
+    State shared between commands, such as the application currently in use.
+    
+    Command handlers describe changes as a "context_update" dictionary, which
+    is applied with apply().
+    """
+    
+    active_app: Optional[str] = None
+    app_state: Optional[str] = None
+    last_action: Optional[str] = None
+    last_shape: Optional[str] = None
+    last_content: Optional[str] = None
+    
+    def apply(self, changes: Dict[str, Any]) -> None:
+        """
+        Apply a context update returned by a command handler.
+        
+        Args:
+            changes: Mapping of field names to their new values
+        """
+        for name, value in changes.items():
+            setattr(self, name, value)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the fields that are set, for components that expect a dictionary.
+        
+        Returns:
+            A dictionary of the non-empty context fields
+        """
+        return {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if getattr(self, field.name) is not None
+        }
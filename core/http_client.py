@@ -0,0 +1,40 @@
+"""
+Summer AI Assistant - HTTP Client
+-------------------------------
+Creates the keep-alive HTTP client shared by the OpenAI-based components.
+"""
+
+from typing import Any, Optional
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # Enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+def create_http_client(max_keepalive_connections: int = 8) -> Optional[Any]:
+    """
+    Create an HTTP client that keeps connections alive between requests.
+    
+    Reusing connections lets later API calls skip the TCP and TLS handshakes.
+    HTTP/2 is used when the h2 package is installed.
+    
+    Args:
+        max_keepalive_connections: Number of idle connections to keep open
+    
+    Returns:
+        An httpx.Client, or None if httpx is not installed
+    """
+    if not HTTPX_AVAILABLE:
+        return None
+    
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=max_keepalive_connections, keepalive_expiry=60),
+        http2=HTTP2_AVAILABLE
+    )
@@ -4,20 +4,82 @@ Summer AI Assistant - LangChain NLP Engine
 Advanced NLP engine using LangChain for sophisticated intent recognition and reasoning.
 """
 
+import asyncio
+import collections
 import logging
 import os
+import time
 import json
-from typing import Dict, Any, Optional, List
+import re
+from typing import Dict, Any, Optional, List, Tuple
 
+from core.nlp_engine import match_fast_path
+
+# Prefer the faster orjson parser when it is installed
 try:
-    from langchain.chains import LLMChain
-    from langchain.prompts import PromptTemplate
-    from langchain_openai import ChatOpenAI
-    from langchain.memory import ConversationBufferMemory
-    from langchain.schema import HumanMessage
-    LANGCHAIN_AVAILABLE = True
+    import orjson
+    _loads = orjson.loads
 except ImportError:
-    LANGCHAIN_AVAILABLE = False
+    _loads = json.loads
+
+# Parameter names the model sometimes uses, per intent: (alias, expected name)
+PARAMETER_ALIASES = {
+    "write_text": ("text", "content"),
+    "draw_shape": ("type", "shape")
+}
+
+# Size and lifetime (seconds) of the per-engine cache of parsed model replies
+RESPONSE_CACHE_MAX = 256
+RESPONSE_CACHE_TTL = 60.0
+
+# Intents whose parameters carry free text, never served from the semantic cache
+FREE_TEXT_INTENTS = frozenset({"write_text", "search_web"})
+
+# Greetings answered directly, without calling the model
+GREETINGS = frozenset({"hello summer", "hi summer", "hey summer"})
+_GREETING_RESPONSE = {"intent": "greeting", "confidence": 1.0}
+
+# Extracts a JSON object from a fenced code block, or else from anywhere in the text
+_JSON_EXTRACT = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
+_DECODER = json.JSONDecoder()
+
+# Structure of the model's reply when json_mode is "schema"
+INTENT_SCHEMA = {
+    "name": "command_intent",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "intent": {"type": "string"},
+            "app_name": {"type": ["string", "null"]},
+            "parameters": {"type": "object"},
+            "confidence": {"type": "number"}
+        },
+        "required": ["intent", "parameters", "confidence"]
+    }
+}
+
+# LangChain classes, imported on first use by _lazy_import_langchain()
+_LANGCHAIN: Dict[str, Any] = {}
+
+def _lazy_import_langchain() -> Any:
+    """
+    Import the LangChain classes used by the engine.
+    
+    LangChain pulls in a large dependency tree, so it is only imported when
+    an engine is actually created. The classes are cached after the first call.
+    
+    Returns:
+        The ChatOpenAI class
+    
+    Raises:
+        ImportError: If LangChain is not installed
+    """
+    if not _LANGCHAIN:
+        from langchain_openai import ChatOpenAI
+        
+        _LANGCHAIN.update(ChatOpenAI=ChatOpenAI)
+    
+    return _LANGCHAIN["ChatOpenAI"]
 
 class LangChainNLPEngine:
     """
@@ -27,25 +89,33 @@ class LangChainNLPEngine:
     including context-aware command understanding and reasoning.
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, http_client: Optional[Any] = None):
         """
         Initialize the LangChain NLP engine with the specified configuration.
         
         Args:
             config: Configuration dictionary for the engine
+            http_client: Optional shared httpx.Client for API requests
         """
         self.logger = logging.getLogger("summer.langchain_nlp")
         self.config = config or {}
         
-        # Check if LangChain is available
-        if not LANGCHAIN_AVAILABLE:
+        # Import LangChain now that the engine is actually needed
+        try:
+            ChatOpenAI = _lazy_import_langchain()
+        except ImportError:
             self.logger.error("LangChain library not found. This engine requires LangChain.")
             raise ImportError("LangChain library is required for this engine.")
         
         # Default configuration
-        self.model_name = self.config.get("model_name", "gpt-4")
+        self.model_name = self.config.get("model_name", "gpt-4o")
         self.temperature = self.config.get("temperature", 0.1)
         
+        # JSON mode makes the model reply with a bare JSON object, and "schema"
+        # additionally holds it to INTENT_SCHEMA (requires a model that
+        # supports response_format, e.g. gpt-4o)
+        self.json_mode = self.config.get("json_mode", True)
+        
         # OpenAI API key from config or environment
         self.api_key = self.config.get("openai_api_key") or os.getenv("OPENAI_API_KEY")
         
@@ -54,17 +124,25 @@ class LangChainNLPEngine:
             raise ValueError("OpenAI API key is required for this engine.")
         
         # Initialize the LLM
+        if self.json_mode == "schema":
+            model_kwargs = {"response_format": {"type": "json_schema", "json_schema": INTENT_SCHEMA}}
+        elif self.json_mode:
+            model_kwargs = {"response_format": {"type": "json_object"}}
+        else:
+            model_kwargs = {}
         self.llm = ChatOpenAI(
             model=self.model_name,
             temperature=self.temperature,
-            api_key=self.api_key
+            api_key=self.api_key,
+            model_kwargs=model_kwargs,
+            max_retries=self.config.get("max_retries", 2),
+            timeout=self.config.get("timeout", 5),
+            http_client=http_client
         )
         
-        # Initialize conversation memory with input_key (IMPORTANT FIX)
-        self.memory = ConversationBufferMemory(
-            memory_key="chat_history",
-            input_key="command"  # Set input_key to make multiple parameters work
-        )
+        # Conversation memory: only the last few (command, response) exchanges
+        # are kept, so the prompt size doesn't grow with the session
+        self.history = collections.deque(maxlen=self.config.get("history_size", 8))
         
         # Generate format instructions
         format_instructions = """The output should be formatted as a JSON object with the following keys:
@@ -80,11 +158,11 @@ For example:
   "parameters": {},
   "confidence": 0.9
 }"""
-        
-        # Define the prompt template
-        self.prompt = PromptTemplate(
-            template="""You are an AI assistant that controls Windows applications through natural language commands.
-            
+
+        # The instructions never change, so they go first in their own system
+        # message, letting the provider reuse its cached prefix across commands
+        system_prompt = """You are an AI assistant that controls Windows applications through natural language commands.
+
 Your task is to understand user commands and convert them into structured intents.
 
 Available intents:
@@ -96,12 +174,17 @@ Available intents:
 - system_command: Execute a system command (like volume control, brightness, etc.)
 
 Here are examples of valid intents with their parameters:
-1. "Open Notepad" -> {{"intent": "open_application", "app_name": "notepad", "parameters": {{}}, "confidence": 0.9}}
-2. "Close Paint" -> {{"intent": "close_application", "app_name": "paint", "parameters": {{}}, "confidence": 0.9}}
-3. "Write hello world in Notepad" -> {{"intent": "write_text", "app_name": "notepad", "parameters": {{"content": "hello world"}}, "confidence": 0.9}}
-4. "Draw a circle in Paint" -> {{"intent": "draw_shape", "app_name": "paint", "parameters": {{"shape": "circle"}}, "confidence": 0.9}}
+1. "Open Notepad" -> {"intent": "open_application", "app_name": "notepad", "parameters": {}, "confidence": 0.9}
+2. "Close Paint" -> {"intent": "close_application", "app_name": "paint", "parameters": {}, "confidence": 0.9}
+3. "Write hello world in Notepad" -> {"intent": "write_text", "app_name": "notepad", "parameters": {"content": "hello world"}, "confidence": 0.9}
+4. "Draw a circle in Paint" -> {"intent": "draw_shape", "app_name": "paint", "parameters": {"shape": "circle"}, "confidence": 0.9}
 
-Previous conversation context:
+"""
+        self.system_message = ("system", system_prompt + format_instructions
+                               + "\n\nOnly respond with the JSON object and nothing else.\n")
+        
+        # Only the user message varies between commands
+        self.prompt_template = """Previous conversation context:
 {chat_history}
 
 Current system state:
@@ -110,22 +193,20 @@ Current system state:
 User command: {command}
 
 Parse this into a structured command with an intent and parameters.
-
-{format_instructions}
-
-Only respond with the JSON object and nothing else.
-""",
-            input_variables=["command", "chat_history", "system_state"],
-            partial_variables={"format_instructions": format_instructions}
-        )
+"""
         
-        # Create the chain
-        self.chain = LLMChain(
-            llm=self.llm,
-            prompt=self.prompt,
-            memory=self.memory,
-            verbose=True
-        )
+        # Split the template around its slots once, so rendering a command is
+        # plain concatenation instead of parsing the template again
+        head, rest = self.prompt_template.split("{chat_history}")
+        after_history, rest = rest.split("{system_state}")
+        after_state, tail = rest.split("{command}")
+        self._prompt_parts = (head, after_history, after_state, tail)
+        
+        # Recently parsed intents keyed by command and context, in LRU order
+        self._response_cache = collections.OrderedDict()
+        
+        # Optional cache matching commands by meaning rather than exact text
+        self.semantic_cache = self._create_semantic_cache()
         
         self.logger.info("LangChain NLP Engine initialized")
     
@@ -144,106 +225,427 @@ Only respond with the JSON object and nothing else.
         self.logger.info(f"Processing text with LangChain: '{text}'")
         
         try:
-            # Handle "Hello Summer" special case
-            if text.lower() in ["hello summer", "hi summer", "hey summer"]:
-                return {
-                    "intent": "greeting",
-                    "parameters": {"greeting": text},
-                    "confidence": 1.0,
-                    "original_text": text
-                }
-            
-            # Convert context to a formatted string
-            system_state = ""
-            if context:
-                system_state = "\n".join([f"- {k}: {v}" for k, v in context.items()])
-            else:
-                system_state = "No specific context provided."
-            
-            # Execute the chain with properly named parameters
-            response = self.chain.predict(
-                command=text,
-                system_state=system_state
-            )
-            
-            # Parse the result
-            try:
-                # First see if it's valid JSON
-                result = json.loads(response)
-            except json.JSONDecodeError:
-                # Try to extract JSON using string operations
-                try:
-                    # Look for JSON in markdown code blocks
-                    if "```json" in response and "```" in response.split("```json", 1)[1]:
-                        json_block = response.split("```json", 1)[1].split("```", 1)[0]
-                        result = json.loads(json_block.strip())
-                    elif "```" in response and "```" in response.split("```", 1)[1]:
-                        json_block = response.split("```", 1)[1].split("```", 1)[0]
-                        result = json.loads(json_block.strip())
-                    else:
-                        # Last resort: clean up the string and try again
-                        cleaned_str = response.strip()
-                        try:
-                            result = json.loads(cleaned_str)
-                        except:
-                            self.logger.error("Could not parse JSON from response")
-                            return {
-                                "intent": "unknown",
-                                "parameters": {},
-                                "confidence": 0.0,
-                                "original_text": text
-                            }
-                except Exception as e:
-                    self.logger.error(f"Error extracting JSON: {e}")
-                    return {
-                        "intent": "unknown",
-                        "parameters": {},
-                        "confidence": 0.0,
-                        "original_text": text
-                    }
+            intent_data, request = self._before_model(text, context)
+            if intent_data is not None:
+                return intent_data
             
-            # Parse the dictionary
-            intent_data = {
-                "intent": result.get("intent", "unknown"),
-                "parameters": result.get("parameters", {}),
-                "confidence": result.get("confidence", 0.5),
-                "original_text": text
-            }
-            
-            # If app_name exists, make sure it's in the parameters as well
-            if "app_name" in result and result["app_name"]:
-                intent_data["parameters"]["app_name"] = result["app_name"]
-            
-            # Fix parameter naming for specific intents
-            self._fix_parameters(intent_data)
+            prompt, cache_key, embedding = request
+            response = self.llm.invoke(prompt).content
+            return self._after_model(text, response, cache_key, embedding)
+        
+        except Exception as e:
+            self.logger.error(f"Error processing with LangChain: {e}")
+            return self._unknown_intent(text)
+    
+    async def aprocess(self, text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Asynchronous counterpart of process() that awaits the model call.
+        
+        Args:
+            text: The text to process
+            context: Optional context information for better understanding
+        
+        Returns:
+            A dictionary containing the recognized intent and parameters
+        """
+        context = context or {}
+        self.logger.info(f"Processing text with LangChain: '{text}'")
+        
+        try:
+            intent_data, request = self._before_model(text, context)
+            if intent_data is not None:
+                return intent_data
             
-            return intent_data
-                
+            prompt, cache_key, embedding = request
+            response = (await self.llm.ainvoke(prompt)).content
+            return self._after_model(text, response, cache_key, embedding)
+        
         except Exception as e:
             self.logger.error(f"Error processing with LangChain: {e}")
-            return {
-                "intent": "unknown",
-                "parameters": {},
-                "confidence": 0.0,
-                "original_text": text
-            }
+            return self._unknown_intent(text)
+    
+    def _before_model(self, text: str, context: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """
+        Try to answer a command without the model, or prepare the model call.
+        
+        Args:
+            text: The text to process
+            context: Context information for the prompt
+        
+        Returns:
+            (intent_data, None) when the command was answered without the model,
+            otherwise (None, (prompt, cache_key, embedding))
+        """
+        # Handle "Hello Summer" special case
+        if text.casefold() in GREETINGS:
+            return self._greeting_intent(text), None
+        
+        # Canonical commands don't need the model at all
+        fast_intent = match_fast_path(text)
+        if fast_intent is not None:
+            return fast_intent, None
+        
+        # Reuse the intent of an identical recent command
+        cache_key = self._cache_key(text, context)
+        cached = self._cache_get(cache_key, text)
+        if cached is not None:
+            self._append_cached_history(text, cached)
+            return cached, None
+        
+        # Reuse the intent of an earlier command with the same meaning
+        cached, embedding = self._semantic_get(cache_key, text)
+        if cached is not None:
+            self._append_cached_history(text, cached)
+            return cached, None
+        
+        return None, (self._render_prompt(text, context), cache_key, embedding)
+    
+    def _after_model(self,
+                     text: str,
+                     response: str,
+                     cache_key: Optional[Tuple[str, int]],
+                     embedding: Any) -> Dict[str, Any]:
+        """
+        Record and parse the model's response, then cache the recognized intent.
+        
+        Args:
+            text: The processed text
+            response: The raw model response
+            cache_key: Cache key from _before_model()
+            embedding: Embedding of the text from _before_model(), if any
+        
+        Returns:
+            A dictionary containing the recognized intent and parameters
+        """
+        self.history.append((text, response))
+        
+        intent_data = self._parse_response(text, response)
+        self._cache_put(cache_key, intent_data, embedding)
+        return intent_data
+    
+    async def process_batch(self,
+                            texts: List[str],
+                            contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+                            max_concurrency: int = 5) -> List[Dict[str, Any]]:
+        """
+        Process several text commands concurrently.
+        
+        The model calls are issued together, so a burst of commands takes about
+        one round-trip instead of one per command.
+        
+        Args:
+            texts: The texts to process
+            contexts: Optional context for each text (same length as texts)
+            max_concurrency: Maximum number of model calls in flight at once
+        
+        Returns:
+            A list of intent dictionaries, in the same order as texts
+        """
+        contexts = contexts or [None] * len(texts)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def limited(text: str, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aprocess(text, context)
+        
+        return await asyncio.gather(
+            *(limited(text, context) for text, context in zip(texts, contexts))
+        )
+    
+    def process_batch_sync(self,
+                           texts: List[str],
+                           contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+                           max_concurrency: int = 5) -> List[Dict[str, Any]]:
+        """
+        Blocking wrapper around process_batch for callers without an event loop.
+        
+        Args:
+            texts: The texts to process
+            contexts: Optional context for each text (same length as texts)
+            max_concurrency: Maximum number of model calls in flight at once
+        
+        Returns:
+            A list of intent dictionaries, in the same order as texts
+        """
+        return asyncio.run(self.process_batch(texts, contexts, max_concurrency))
+    
+    def clear_cache(self) -> None:
+        """Forget all cached intents."""
+        self._response_cache.clear()
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+    
+    def _create_semantic_cache(self) -> Optional[Any]:
+        """
+        Create the semantic cache if it is enabled in the configuration.
+        
+        Returns:
+            The semantic cache, or None if disabled or unavailable
+        """
+        cache_config = self.config.get("semantic_cache", {})
+        if not cache_config.get("enabled", False):
+            return None
+        
+        # Imported here so numpy is only loaded when the cache is enabled
+        from core.semantic_cache import SemanticCache, create_encoder
+        
+        try:
+            return SemanticCache(
+                create_encoder(cache_config, self.api_key),
+                threshold=cache_config.get("threshold", 0.93),
+                max_entries=cache_config.get("max_entries", 1024)
+            )
+        except Exception as e:
+            self.logger.warning(f"Semantic cache disabled: {e}")
+            return None
+    
+    def _semantic_get(self, key: Optional[Tuple[str, int]], text: str) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """
+        Look up the intent of a semantically similar earlier command.
+        
+        Args:
+            key: The cache key from _cache_key
+            text: The command text
+        
+        Returns:
+            A tuple of (copy of the cached intent or None, embedding of the text or None)
+        """
+        if self.semantic_cache is None or key is None:
+            return None, None
+        
+        try:
+            embedding = self.semantic_cache.embed(text)
+        except Exception as e:
+            self.logger.error(f"Error computing embedding: {e}")
+            return None, None
+        
+        intent_data = self.semantic_cache.lookup(embedding, key[1])
+        if intent_data is None:
+            return None, embedding
+        
+        self.logger.debug("Semantic cache hit for '%s'", text)
+        return {
+            **intent_data,
+            "parameters": dict(intent_data["parameters"]),
+            "original_text": text
+        }, embedding
+    
+    def _cache_key(self, text: str, context: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+        """
+        Build the response cache key for a command.
+        
+        Args:
+            text: The command text
+            context: The context the command is processed in
+        
+        Returns:
+            The cache key, or None if the context can't be hashed
+        """
+        # The exact text, since free-text parameters keep the user's casing
+        try:
+            return (text, hash(frozenset(context.items())) if context else 0)
+        except TypeError:
+            return None
+    
+    def _cache_get(self, key: Optional[Tuple[str, int]], text: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached intent.
+        
+        Args:
+            key: The cache key from _cache_key
+            text: The command text, stored as original_text in the result
+        
+        Returns:
+            A copy of the cached intent, or None on a miss or expired entry
+        """
+        if key is None or key not in self._response_cache:
+            return None
+        
+        expires_at, intent_data = self._response_cache[key]
+        if time.monotonic() >= expires_at:
+            del self._response_cache[key]
+            return None
+        
+        self._response_cache.move_to_end(key)
+        self.logger.debug("Response cache hit for '%s'", text)
+        return {
+            **intent_data,
+            "parameters": dict(intent_data["parameters"]),
+            "original_text": text
+        }
+    
+    def _cache_put(self,
+                   key: Optional[Tuple[str, int]],
+                   intent_data: Dict[str, Any],
+                   embedding: Any = None) -> None:
+        """
+        Store a recognized intent in the cache, evicting the oldest entry if full.
+        
+        Args:
+            key: The cache key from _cache_key
+            intent_data: The parsed intent to cache
+            embedding: Embedding of the command for the semantic cache, if computed
+        """
+        # Don't cache failures, the next attempt may succeed
+        if key is None or intent_data.get("intent") == "unknown":
+            return
+        
+        self._response_cache[key] = (
+            time.monotonic() + RESPONSE_CACHE_TTL,
+            {**intent_data, "parameters": dict(intent_data["parameters"])}
+        )
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_MAX:
+            self._response_cache.popitem(last=False)
+        
+        # Similar wording may carry different free text, so only cache
+        # intents whose parameters don't depend on it
+        if embedding is not None and intent_data.get("intent") not in FREE_TEXT_INTENTS:
+            self.semantic_cache.add(
+                embedding,
+                key[1],
+                {**intent_data, "parameters": dict(intent_data["parameters"])}
+            )
+    
+    def _append_cached_history(self, text: str, intent_data: Dict[str, Any]) -> None:
+        """
+        Record a command answered from a cache in the conversation history.
+        
+        Args:
+            text: The command text
+            intent_data: The cached intent, stored in the form the model answers in
+        """
+        response = json.dumps({"intent": intent_data["intent"], "parameters": intent_data["parameters"]})
+        self.history.append((text, response))
+    
+    def _render_prompt(self, text: str, context: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """
+        Render the prompt messages for a command.
+        
+        Args:
+            text: The command text
+            context: Context information to describe in the prompt
+        
+        Returns:
+            The static system message followed by the user message
+        """
+        # Convert context to a formatted string
+        if context:
+            system_state = "\n".join([f"- {k}: {v}" for k, v in context.items()])
+        else:
+            system_state = "No specific context provided."
+        
+        chat_history = "\n".join(
+            f"Human: {command}\nAI: {response}" for command, response in self.history
+        )
+        head, after_history, after_state, tail = self._prompt_parts
+        return [
+            self.system_message,
+            ("human", f"{head}{chat_history}{after_history}{system_state}{after_state}{text}{tail}")
+        ]
+    
+    def _parse_response(self, text: str, response: str) -> Dict[str, Any]:
+        """
+        Convert the model's reply into an intent dictionary.
+        
+        Args:
+            text: The original command text
+            response: The raw text returned by the model
+        
+        Returns:
+            A dictionary containing the recognized intent and parameters
+        """
+        # Parse the result
+        if self.json_mode:
+            # JSON mode guarantees a bare JSON object
+            result = _loads(response)
+        else:
+            result = self._extract_json(response)
+            if result is None:
+                return self._unknown_intent(text)
+        
+        # Parse the dictionary
+        intent_data = {
+            "intent": result.get("intent", "unknown"),
+            "parameters": result.get("parameters", {}),
+            "confidence": result.get("confidence", 0.5),
+            "original_text": text
+        }
+        
+        # If app_name exists, make sure it's in the parameters as well
+        if "app_name" in result and result["app_name"]:
+            intent_data["parameters"]["app_name"] = result["app_name"]
+        
+        # Fix parameter naming for specific intents
+        self._fix_parameters(intent_data)
+        
+        return intent_data
+    
+    def _greeting_intent(self, text: str) -> Dict[str, Any]:
+        """Build the intent dictionary for a greeting."""
+        return {
+            **_GREETING_RESPONSE,
+            "parameters": {"greeting": text},
+            "original_text": text
+        }
+    
+    def _unknown_intent(self, text: str) -> Dict[str, Any]:
+        """Build the intent dictionary for a command that wasn't understood."""
+        return {
+            "intent": "unknown",
+            "parameters": {},
+            "confidence": 0.0,
+            "original_text": text
+        }
+    
+    def _extract_json(self, response: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract a JSON object from a free-form model reply.
+        
+        Args:
+            response: The raw text returned by the model
+        
+        Returns:
+            The parsed JSON object, or None if none could be parsed
+        """
+        try:
+            # First see if it's valid JSON
+            return _loads(response)
+        except json.JSONDecodeError:
+            pass
+        
+        # Look for a JSON object in a markdown code block or in the raw text
+        match = _JSON_EXTRACT.search(response)
+        if match is None:
+            self.logger.error("No JSON object found in response")
+            return None
+        
+        candidate = match.group(1) or match.group(2)
+        try:
+            return _loads(candidate)
+        except ValueError:
+            pass
+        
+        # The greedy match can run past the object, so decode only the first one
+        try:
+            return _DECODER.raw_decode(candidate)[0]
+        except ValueError as e:
+            self.logger.error(f"Could not parse JSON from response: {e}")
+            return None
     
     def _fix_parameters(self, intent_data: Dict[str, Any]) -> None:
         """Fix parameter names to match what the command processor expects."""
         intent = intent_data.get("intent", "")
         parameters = intent_data.get("parameters", {})
         
-        # For write_text intent, ensure content parameter is present
-        if intent == "write_text":
-            if "text" in parameters and "content" not in parameters:
-                parameters["content"] = parameters["text"]
-            elif not parameters.get("content"):
-                parameters["content"] = intent_data.get("original_text", "")
-        
-        # For draw_shape intent, ensure shape parameter is present
-        if intent == "draw_shape":
-            if "type" in parameters and "shape" not in parameters:
-                parameters["shape"] = parameters["type"]
+        # Copy an aliased parameter to the name the command processor expects
+        source, target = PARAMETER_ALIASES.get(intent, (None, None))
+        if source in parameters:
+            parameters.setdefault(target, parameters[source])
+        
+        # For write_text intent, fall back to the whole command as content
+        if intent == "write_text" and not parameters.get("content"):
+            parameters["content"] = intent_data.get("original_text", "")
     
     def shutdown(self):
         """Release resources and shutdown the engine."""
@@ -7,6 +7,8 @@ Handles speech recognition to convert spoken commands to text.
 import logging
 import time
 import os
+import queue
+import threading
 from typing import Dict, Any, Optional, List
 
 # Speech recognition libraries
@@ -38,6 +40,34 @@ class Listener:
         self.phrase_time_limit = self.config.get("phrase_time_limit", 5)
         self.energy_threshold = self.config.get("energy_threshold", 300)
         
+        # Background listening state
+        self._active = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._queue = None
+        
+        # The microphone can only be opened by one thread at a time
+        self._microphone_lock = threading.Lock()
+        self._calibrated = threading.Event()
+        
+        # Load the local recognition model up front, falling back to Google without it
+        # (imported here so the other engines don't pay for loading numpy and faster-whisper)
+        self._whisper_model = None
+        self._np = None
+        if self.engine == "faster_whisper":
+            try:
+                import numpy as np
+                from faster_whisper import WhisperModel
+            except ImportError:
+                self.logger.warning("faster-whisper or numpy not found. Using Google speech recognition.")
+                self.engine = "google"
+            else:
+                self._np = np
+                self._whisper_model = WhisperModel(
+                    self.config.get("whisper_model", "base.en"),
+                    compute_type=self.config.get("whisper_compute_type", "int8")
+                )
+        
         # Check if speech_recognition is available
         if sr is None:
             self.logger.warning("speech_recognition library not found. Using mock implementation.")
@@ -49,15 +79,55 @@ class Listener:
             self.recognizer.energy_threshold = self.energy_threshold
             self.microphone = sr.Microphone()
             
-            # Adjust for ambient noise (optional)
+            # Adjust for ambient noise (optional) in the background, so the rest
+            # of startup doesn't wait for it
             if self.config.get("adjust_for_ambient_noise", True):
-                with self.microphone as source:
-                    self.logger.info("Adjusting for ambient noise...")
-                    self.recognizer.adjust_for_ambient_noise(source)
-                    self.logger.info("Ambient noise adjustment complete")
+                threading.Thread(target=self._calibrate, name="summer-calibrate", daemon=True).start()
+            else:
+                self._calibrated.set()
         
         self.logger.info(f"Listener initialized with engine: {self.engine}")
     
+    def _calibrate(self) -> None:
+        """Adjust the energy threshold to the ambient noise level."""
+        try:
+            with self._microphone_lock, self.microphone as source:
+                self.logger.info("Adjusting for ambient noise...")
+                self.recognizer.adjust_for_ambient_noise(source)
+                self.logger.info("Ambient noise adjustment complete")
+        except Exception as e:
+            self.logger.error(f"Error adjusting for ambient noise: {e}")
+        finally:
+            self._calibrated.set()
+    
+    def _transcribe_local(self, audio) -> str:
+        """
+        Transcribe audio with the local faster-whisper model.
+        
+        Args:
+            audio: The captured sr.AudioData
+        
+        Returns:
+            The recognized text
+        
+        Raises:
+            sr.UnknownValueError: If no speech was recognized
+        """
+        # Whisper expects 16 kHz mono float samples in [-1, 1]
+        raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+        np = self._np
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        
+        segments, _ = self._whisper_model.transcribe(samples, beam_size=1)
+        text = "".join(segment.text for segment in segments).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+    
+    def _uses_keyboard(self) -> bool:
+        """Check whether commands are typed instead of spoken."""
+        return self.recognizer is None or os.getenv("USE_KEYBOARD", "0") == "1"
+    
     def listen(self) -> Optional[str]:
         """
         Listen for a single command.
@@ -65,13 +135,16 @@ class Listener:
         Returns:
             The recognized text, or None if recognition failed
         """
-        if self.recognizer is None or os.getenv("USE_KEYBOARD", "0") == "1":
+        if self._uses_keyboard():
             self.logger.info("Using keyboard input")
             # Use keyboard input for testing or when speech recognition is unavailable
             return input("Enter command: ")
         
+        # Don't listen with the energy threshold from before the calibration
+        self._calibrated.wait()
+        
         try:
-            with self.microphone as source:
+            with self._microphone_lock, self.microphone as source:
                 self.logger.info(f"Listening (timeout: {self.timeout}s)...")
                 
                 # Listen for audio
@@ -91,6 +164,8 @@ class Listener:
                 elif self.engine == "whisper":
                     # Requires the whisper library to be installed
                     text = self.recognizer.recognize_whisper(audio)
+                elif self.engine == "faster_whisper":
+                    text = self._transcribe_local(audio)
                 else:
                     self.logger.error(f"Unknown speech recognition engine: {self.engine}")
                     return None
@@ -111,8 +186,69 @@ class Listener:
             self.logger.exception(f"Error during speech recognition: {e}")
             return None
     
+    def start_background(self, command_queue: "queue.Queue[Optional[str]]") -> None:
+        """
+        Start listening on a background thread.
+        
+        Recognized commands are pushed into the given queue, so the caller can
+        block on it instead of polling the listener. None is pushed if the
+        listener stops on its own because keyboard input was closed.
+        
+        Args:
+            command_queue: Queue that receives recognized command text
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        self._queue = command_queue
+        self._stopped.clear()
+        self._active.set()
+        self._thread = threading.Thread(
+            target=self._listen_loop,
+            name="summer-listener",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def pause(self) -> None:
+        """Pause background listening; the thread parks until resumed."""
+        self._active.clear()
+    
+    def resume(self) -> None:
+        """Resume background listening."""
+        self._active.set()
+    
+    def _listen_loop(self) -> None:
+        """Listen continuously and forward recognized commands to the queue."""
+        while not self._stopped.is_set():
+            # Block (without waking up) while listening is paused
+            self._active.wait()
+            if self._stopped.is_set():
+                break
+            
+            try:
+                text = self.listen()
+            except EOFError:
+                # Keyboard input was closed, nothing more to read; tell the consumer
+                self.logger.info("Input stream closed, stopping listener")
+                self._queue.put(None)
+                break
+            
+            if not text:
+                continue
+            
+            # Drop speech recorded while listening was paused (e.g. the assistant's own reply);
+            # typed commands can't be picked up from the speakers, so they are always kept
+            if not self._active.is_set() and not self._uses_keyboard():
+                self.logger.debug("Dropped speech captured while paused: '%s'", text)
+                continue
+            
+            self._queue.put(text)
+    
     def shutdown(self):
         """Release resources and shutdown the listener."""
         self.logger.info("Shutting down listener")
-        # Nothing specific to clean up in this implementation
-        # But this method is part of the component interface
\ No newline at end of file
+        
+        # Stop the background thread, waking it up if it is paused
+        self._stopped.set()
+        self._active.set()
\ No newline at end of file
@@ -4,9 +4,65 @@ Summer AI Assistant - Basic NLP Engine
 Simple NLP engine for basic intent recognition.
 """
 
+import functools
 import logging
 import re
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+
+from core.command_processor import APP_NAME_MAPPING
+
+# Use the linear-time RE2 engine for the fast-path patterns when available
+try:
+    import re2 as _fast_re
+except ImportError:
+    _fast_re = re
+
+# Start of a named group in a pattern
+_GROUP_NAME = re.compile(r"\(\?P<(\w+)>")
+
+# Application names the fast path accepts. Anything else, such as "close it",
+# needs the full NLP engine to resolve it from the context.
+_APP_NAMES = "|".join(sorted(APP_NAME_MAPPING, key=len, reverse=True))
+
+# Polite wording allowed around a canonical command, e.g. "could you close paint please"
+_POLITE_PREFIX = r"(?:(?:please|can\s+you|could\s+you|would\s+you)\s+)?"
+_POLITE_SUFFIX = r"(?:\s+please)?"
+
+# Canonical commands recognized without the full NLP engine: (pattern, intent).
+# The whole utterance must match, so "don't close paint" is never taken.
+FAST_PATH_PATTERNS = [
+    (_fast_re.compile(rf"(?i)^\s*{_POLITE_PREFIX}(?:open|launch|start)\s+(?P<app_name>{_APP_NAMES})"
+                      rf"{_POLITE_SUFFIX}\s*$"),
+     "open_application"),
+    (_fast_re.compile(rf"(?i)^\s*{_POLITE_PREFIX}(?:close|exit|quit)\s+(?P<app_name>{_APP_NAMES})"
+                      rf"{_POLITE_SUFFIX}\s*$"),
+     "close_application"),
+    (_fast_re.compile(rf"(?i)^\s*{_POLITE_PREFIX}draw\s+(?:an?\s+)?(?P<shape>circle|oval|square|rectangle|line)"
+                      rf"(?:\s+in\s+(?P<app_name>{_APP_NAMES}))?{_POLITE_SUFFIX}\s*$"),
+     "draw_shape"),
+]
+
+def match_fast_path(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Recognize a canonical command with the fast-path patterns.
+    
+    Args:
+        text: The command text
+    
+    Returns:
+        The intent dictionary, or None if no pattern matched
+    """
+    for pattern, intent in FAST_PATH_PATTERNS:
+        match = pattern.match(text)
+        if match:
+            parameters = {k: v.lower() for k, v in match.groupdict().items() if v}
+            return {
+                "intent": intent,
+                "parameters": parameters,
+                "confidence": 0.95,
+                "original_text": text
+            }
+    return None
 
 class NLPEngine:
     """
@@ -48,6 +104,30 @@ class NLPEngine:
             ]
         }
         
+        # Compile every pattern once, in matching order
+        self._compiled = [
+            (intent, re.compile(pattern, re.IGNORECASE))
+            for intent, patterns in self.patterns.items()
+            for pattern in patterns
+        ]
+        
+        # Fuse every pattern into one alternation, so most utterances are scanned once.
+        # Group names must be unique, so each pattern's groups get its own prefix.
+        alternatives = []
+        self._alternatives = {}
+        for intent, patterns in self.patterns.items():
+            for pattern in patterns:
+                index = len(alternatives)
+                prefix = f"I{index}"
+                groups = {f"{prefix}_{name}": name for name in _GROUP_NAME.findall(pattern)}
+                renamed = _GROUP_NAME.sub(rf"(?P<{prefix}_\1>", pattern)
+                alternatives.append(f"(?P<{prefix}>{renamed})")
+                self._alternatives[prefix] = (index, intent, groups)
+        self._combined = re.compile("|".join(alternatives), re.IGNORECASE)
+        
+        # Matching is deterministic, so results are memoized per text
+        self._match = functools.lru_cache(maxsize=self.config.get("cache_size", 4096))(self._match_text)
+        
         self.logger.info("Basic NLP Engine initialized")
     
     def process(self, text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -64,23 +144,17 @@ class NLPEngine:
         context = context or {}
         self.logger.info(f"Processing text: '{text}'")
         
-        # Convert to lowercase for easier matching
-        text = text.lower().strip()
+        # Patterns are case-insensitive, so only surrounding whitespace is removed
+        text = text.strip()
         
-        # Try to match patterns for each intent
-        for intent, patterns in self.patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text)
-                if match:
-                    # Extract parameters from the match groups
-                    parameters = {k: v.strip() for k, v in match.groupdict().items() if v}
-                    
-                    return {
-                        "intent": intent,
-                        "parameters": parameters,
-                        "confidence": 0.8,  # Fixed confidence for rule-based matching
-                        "original_text": text
-                    }
+        intent, parameters = self._match(text)
+        if intent is not None:
+            return {
+                "intent": intent,
+                "parameters": dict(parameters),
+                "confidence": 0.8,  # Fixed confidence for rule-based matching
+                "original_text": text
+            }
         
         # If no pattern matched, return unknown intent
         return {
@@ -90,6 +164,36 @@ class NLPEngine:
             "original_text": text
         }
     
+    def _match_text(self, text: str) -> Tuple[Optional[str], Tuple[Tuple[str, str], ...]]:
+        """
+        Match a command against the patterns.
+        
+        Args:
+            text: The stripped command text
+        
+        Returns:
+            A tuple of (intent or None, parameters as immutable (name, value) pairs)
+        """
+        # The fused search finds the leftmost command; the outer group of the
+        # matching alternative closes last
+        match = self._combined.search(text)
+        if not match:
+            return None, ()
+        
+        index, intent, groups = self._alternatives[match.lastgroup]
+        
+        # Patterns declared earlier take priority even when they match further
+        # right, e.g. "close the door and open notepad" opens Notepad
+        for earlier_intent, rx in self._compiled[:index]:
+            earlier = rx.search(text)
+            if earlier:
+                return earlier_intent, tuple((k, v.strip()) for k, v in earlier.groupdict().items() if v)
+        
+        # Extract parameters from the alternative's groups
+        parameters = tuple((name, value.strip()) for group, name in groups.items()
+                           if (value := match.group(group)))
+        return intent, parameters
+    
     def shutdown(self):
         """Release resources and shutdown the engine."""
         self.logger.info("Shutting down basic NLP engine")
@@ -6,8 +6,11 @@ Generates appropriate responses based on intent results.
 
 import logging
 import random
+import string
 from typing import Dict, Any, Optional, List
 
+from core.context import Context
+
 class ResponseGenerator:
     """
     Generates appropriate responses to user commands based on the results.
@@ -26,9 +29,24 @@ class ResponseGenerator:
         self.logger = logging.getLogger("summer.response_generator")
         self.config = config or {}
         
+        # Private generator for template selection, independent of the global random state
+        self._rng = random.Random()
+        
         # Load response templates
         self.templates = self._load_templates()
         
+        # Flatten to (status, intent or error type) -> templates for single lookups,
+        # each paired with the parameter names it needs
+        formatter = string.Formatter()
+        self._flat_templates = {
+            (status, name): tuple(
+                (template, frozenset(field for _, field, _, _ in formatter.parse(template) if field))
+                for template in templates
+            )
+            for status, by_name in self.templates.items()
+            for name, templates in by_name.items()
+        }
+        
         self.logger.info("Response generator initialized")
     
     def _load_templates(self) -> Dict[str, Dict[str, List[str]]]:
@@ -95,38 +113,31 @@ class ResponseGenerator:
     def generate(self, 
                 intent_data: Dict[str, Any], 
                 result: Dict[str, Any], 
-                context: Optional[Dict[str, Any]] = None) -> str:
+                context: Optional[Context] = None) -> str:
         """
         Generate a natural language response based on the intent and result.
         
         Args:
             intent_data: The recognized intent data
             result: The result of executing the command
-            context: Optional context information
+            context: Optional conversation context
         
         Returns:
             A natural language response
         """
-        context = context or {}
-        
         intent = intent_data.get("intent", "unknown")
         parameters = intent_data.get("parameters", {})
         
         # Determine if the result was successful
         success = result.get("success", False)
         
-        # Get the appropriate template category
+        # Get templates specific to this intent or error type, else the category default
         if success:
-            templates = self.templates["success"]
-            # Try to get templates specific to this intent
-            response_templates = templates.get(intent, templates["default"])
+            status, name = "success", intent
         else:
-            templates = self.templates["error"]
-            error_type = result.get("error_type", "default")
-            response_templates = templates.get(error_type, templates["default"])
-        
-        # Select a random template
-        template = random.choice(response_templates)
+            status, name = "error", result.get("error_type", "default")
+        response_templates = (self._flat_templates.get((status, name))
+                              or self._flat_templates[(status, "default")])
         
         # Combine all available parameters for formatting
         format_params = {**parameters, **result}
@@ -138,15 +149,15 @@ class ResponseGenerator:
         if "shape" in parameters:
             format_params["shape"] = parameters["shape"].lower()
         
-        # Format the template with the parameters
-        try:
-            response = template.format(**format_params)
-        except KeyError as e:
-            self.logger.error(f"Missing parameter in template: {e}")
+        # Select a random template among those whose parameters are all available
+        candidates = [template for template, fields in response_templates
+                      if fields <= format_params.keys()]
+        if not candidates:
+            self.logger.error("No template for '%s' has all its parameters", name)
             # Fall back to the result message
-            response = result.get("message", "Task completed.")
+            return result.get("message", "Task completed.")
         
-        return response
+        return candidates[self._rng.randrange(len(candidates))].format(**format_params)
     
     def generate_error(self, error_message: str) -> str:
         """
@@ -164,7 +175,7 @@ class ResponseGenerator:
             "I couldn't complete that action because: {error}"
         ]
         
-        template = random.choice(templates)
+        template = templates[self._rng.randrange(len(templates))]
         return template.format(error=error_message)
     
     def shutdown(self):
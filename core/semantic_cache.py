@@ -0,0 +1,147 @@
+"""
+Summer AI Assistant - Semantic Cache
+----------------------------------
+Reuses recognized intents for commands that mean the same as an earlier one.
+"""
+
+from typing import Dict, Any, Optional, Callable
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+def create_encoder(config: Dict[str, Any], api_key: Optional[str] = None) -> Callable[[str], Any]:
+    """
+    Create a function that turns text into an embedding vector.
+    
+    A local sentence-transformers model is used when installed, otherwise
+    OpenAI's embedding API.
+    
+    Args:
+        config: The semantic cache configuration
+        api_key: OpenAI API key for the fallback encoder
+    
+    Returns:
+        A function mapping a string to a 1-D embedding
+    
+    Raises:
+        ImportError: If neither encoder backend is installed
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+        model = SentenceTransformer(config.get("local_model", "all-MiniLM-L6-v2"))
+        return lambda text: model.encode(text, normalize_embeddings=True)
+    except ImportError:
+        from langchain_openai import OpenAIEmbeddings
+        embeddings = OpenAIEmbeddings(
+            model=config.get("openai_model", "text-embedding-3-small"),
+            api_key=api_key
+        )
+        return embeddings.embed_query
+
+class SemanticCache:
+    """
+    Cache of intents keyed by the meaning of the command text.
+    
+    Embeddings are kept in a single (entries, dimensions) matrix, so a lookup
+    is one matrix-vector product. Entries are only matched within the same
+    context, and the least recently used entry is replaced when the cache is full.
+    """
+    
+    def __init__(self,
+                 encode: Callable[[str], Any],
+                 threshold: float = 0.93,
+                 max_entries: int = 1024):
+        """
+        Initialize an empty semantic cache.
+        
+        Args:
+            encode: Function turning text into an embedding vector
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached intents
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for the semantic cache.")
+        
+        self.encode = encode
+        self.threshold = threshold
+        self.max_entries = max_entries
+        
+        # The embedding matrix is allocated once the dimension is known
+        self._embeddings = None
+        self._context_keys = np.zeros(max_entries, dtype=np.int64)
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._entries = []
+        self._clock = 0
+    
+    def embed(self, text: str):
+        """
+        Compute the normalized embedding of a command.
+        
+        Args:
+            text: The command text
+        
+        Returns:
+            A unit-length float32 vector
+        """
+        vector = np.asarray(self.encode(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def lookup(self, embedding, context_key: int) -> Optional[Dict[str, Any]]:
+        """
+        Find the cached intent of the most similar command.
+        
+        Args:
+            embedding: The embedding of the command, from embed()
+            context_key: Hash of the context the command is processed in
+        
+        Returns:
+            The cached intent, or None if nothing is similar enough
+        """
+        count = len(self._entries)
+        if count == 0:
+            return None
+        
+        similarities = self._embeddings[:count] @ embedding
+        similarities[self._context_keys[:count] != context_key] = -1.0
+        
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        
+        self._clock += 1
+        self._last_used[best] = self._clock
+        return self._entries[best]
+    
+    def add(self, embedding, context_key: int, intent_data: Dict[str, Any]) -> None:
+        """
+        Store the intent recognized for a command.
+        
+        Args:
+            embedding: The embedding of the command, from embed()
+            context_key: Hash of the context the command was processed in
+            intent_data: The recognized intent
+        """
+        if self._embeddings is None:
+            self._embeddings = np.zeros((self.max_entries, embedding.shape[0]), dtype=np.float32)
+        
+        if len(self._entries) < self.max_entries:
+            slot = len(self._entries)
+            self._entries.append(intent_data)
+        else:
+            # Replace the least recently used entry
+            slot = int(np.argmin(self._last_used))
+            self._entries[slot] = intent_data
+        
+        self._clock += 1
+        self._embeddings[slot] = embedding
+        self._context_keys[slot] = context_key
+        self._last_used[slot] = self._clock
+    
+    def clear(self) -> None:
+        """Forget all cached intents."""
+        self._entries = []
+        self._last_used[:] = 0
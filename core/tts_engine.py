@@ -4,13 +4,19 @@ Summer AI Assistant - Text-to-Speech Engine
 Converts text responses to spoken audio using OpenAI's TTS API.
 """
 
+import ctypes
+import hashlib
 import logging
 import os
+import queue
 import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from core.http_client import create_http_client
+
 try:
     import vlc
     VLC_AVAILABLE = True
@@ -23,6 +29,67 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+try:
+    import mutagen
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
+# Extra time allowed past a response's expected duration before playback is
+# considered stuck, in seconds
+PLAYBACK_MARGIN = 5.0
+
+# Size of the chunks read from the streaming API response
+STREAM_CHUNK_SIZE = 4096
+
+# Audio buffered before playback starts, enough for the decoder to sync
+STREAM_START_BYTES = 8192
+
+class _AudioStream:
+    """
+    Feeds audio chunks to VLC as they arrive from the API.
+    
+    VLC pulls data through the read callback on its own thread, blocking
+    until the next chunk is fed or the stream is finished.
+    """
+    
+    def __init__(self):
+        """Initialize an empty stream."""
+        self._chunks = queue.Queue()
+        self._pending = b""
+        self.buffered = 0
+        
+        # The ctypes callback must stay referenced while VLC may call it
+        self._read_cb = vlc.CallbackDecorators.MediaReadCb(self._read)
+    
+    def media(self, instance):
+        """Create a VLC media that reads from this stream."""
+        return instance.media_new_callbacks(None, self._read_cb, None, None, None)
+    
+    def feed(self, chunk: bytes) -> None:
+        """Append a chunk of audio data."""
+        self.buffered += len(chunk)
+        self._chunks.put(chunk)
+    
+    def finish(self) -> None:
+        """Mark the end of the stream."""
+        self._chunks.put(None)
+    
+    def _read(self, opaque, buffer, length: int) -> int:
+        """VLC read callback: copy up to length bytes into buffer, 0 at the end."""
+        if not self._pending:
+            chunk = self._chunks.get()
+            if chunk is None:
+                # Stay at the end for any further reads
+                self._chunks.put(None)
+                return 0
+            self._pending = chunk
+        
+        size = min(length, len(self._pending))
+        ctypes.memmove(buffer, self._pending, size)
+        self._pending = self._pending[size:]
+        return size
+
 class TTSEngine:
     """
     Text-to-Speech engine that converts text responses to spoken audio.
@@ -30,12 +97,13 @@ class TTSEngine:
     This class uses OpenAI's TTS API to generate natural-sounding speech.
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, http_client: Optional[Any] = None):
         """
         Initialize the TTS engine with the specified configuration.
         
         Args:
             config: Configuration dictionary for the TTS engine
+            http_client: Optional shared httpx.Client for API requests
         """
         self.logger = logging.getLogger("summer.tts")
         self.config = config or {}
@@ -43,7 +111,7 @@ class TTSEngine:
         # Default configuration
         self.voice = self.config.get("voice", "nova")  # Female voice
         self.model = self.config.get("model", "gpt-4o-mini-tts")
-        self.output_format = self.config.get("output_format", "mp3")
+        self.output_format = self.config.get("output_format", "opus")
         self.instructions = self.config.get("instructions", "Speak in a natural, helpful tone.")
         self.enabled = self.config.get("enabled", True)
         
@@ -58,10 +126,19 @@ class TTSEngine:
         # Check if VLC is available for audio playback
         if not VLC_AVAILABLE:
             self.logger.warning("VLC library not found. Will use system default player.")
+            
+            # Stock Windows has no default player for Opus files
+            if self.output_format == "opus":
+                self.logger.info("Using mp3 output for the system default player")
+                self.output_format = "mp3"
         
         # Initialize OpenAI client if API key is available
+        self._http = None  # Client owned (and closed) by this engine
         if self.enabled and self.api_key:
-            self.client = OpenAI(api_key=self.api_key)
+            # Keep connections alive so later calls skip the TCP and TLS handshakes
+            if http_client is None:
+                self._http = http_client = create_http_client(max_keepalive_connections=4)
+            self.client = OpenAI(api_key=self.api_key, http_client=http_client)
         else:
             if self.enabled:
                 self.logger.warning("OpenAI API key not found. TTS will be disabled.")
@@ -71,10 +148,32 @@ class TTSEngine:
         # Create a temporary directory for audio files
         self.temp_dir = tempfile.mkdtemp(prefix="summer_tts_")
         
+        # Generated speech is kept on disk and replayed for repeated responses
+        self.cache_dir = None
+        self.cache_max_bytes = int(self.config.get("cache_max_mb", 50) * 1024 * 1024)
+        if self.config.get("cache_enabled", True):
+            self.cache_dir = Path(self.config.get("cache_dir", "~/.cache/summer_tts")).expanduser()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
         # Initialize player
         self.player = None
+        self._media_player = None
+        self._media = None
+        self._stream = None
+        self._playback_finished = threading.Event()
+        
+        # Guards the player against being used by the TTS worker after shutdown() released it
+        self._player_lock = threading.Lock()
+        self._stopped = False
         if VLC_AVAILABLE:
             self.player = vlc.Instance("--no-video")
+            
+            # One media player is reused for every response; only its media changes
+            self._media_player = self.player.media_player_new()
+            events = self._media_player.event_manager()
+            for event_type in (vlc.EventType.MediaPlayerEndReached,
+                               vlc.EventType.MediaPlayerEncounteredError):
+                events.event_attach(event_type, lambda event: self._playback_finished.set())
         
         self.logger.info(f"TTS Engine initialized with voice: {self.voice}, enabled: {self.enabled}")
     
@@ -92,71 +191,242 @@ class TTSEngine:
             self.logger.warning("TTS is disabled or not configured properly")
             return False
         
+        # A response still queued on the worker when the engine was shut down
+        if self._stopped:
+            return False
+        
         try:
             self.logger.info(f"Converting to speech: '{text}'")
             
-            # Generate a unique filename
-            timestamp = int(time.time())
-            speech_file_path = Path(self.temp_dir) / f"speech_{timestamp}.{self.output_format}"
+            # Replay a response generated before without calling the API
+            speech_file_path = self._speech_file_path(text)
+            if self.cache_dir is not None and speech_file_path.exists():
+                self.logger.debug("TTS cache hit for '%s'", text)
+                os.utime(speech_file_path)
+                self._play_audio(speech_file_path, text)
+                return True
             
-            # Call the OpenAI API to generate speech
-            response = self.client.audio.speech.create(
+            # Call the OpenAI API to generate speech, reading the audio as it arrives
+            with self.client.audio.speech.with_streaming_response.create(
                 model=self.model,
                 voice=self.voice,
                 input=text,
-                instructions=self.instructions
-            )
-            
-            # Save to file
-            response.stream_to_file(str(speech_file_path))
-            
-            # Play the audio
-            self._play_audio(speech_file_path)
+                instructions=self.instructions,
+                response_format=self.output_format
+            ) as response:
+                if VLC_AVAILABLE and self.player:
+                    # Start playing while the rest of the audio downloads
+                    self._play_stream(response, speech_file_path, text)
+                else:
+                    # The system player needs the complete file
+                    partial_path = speech_file_path.with_suffix(".part")
+                    response.stream_to_file(str(partial_path))
+                    partial_path.replace(speech_file_path)
+                    self._play_audio(speech_file_path, text)
             
+            self._evict_cache()
             return True
             
         except Exception as e:
             self.logger.error(f"Error in TTS: {e}")
             return False
     
-    def _play_audio(self, file_path: Path) -> None:
+    def _play_stream(self, response, file_path: Path, text: str) -> None:
+        """
+        Play streamed audio with VLC as soon as enough of it has arrived.
+        
+        The audio is saved to file_path as well, once it is complete.
+        
+        Args:
+            response: The streaming speech response
+            file_path: Path to save the audio to
+            text: The spoken text, used to estimate the duration if it can't be read
+        """
+        stream = _AudioStream()
+        if not self._set_media(stream.media(self.player)):
+            return
+        
+        # VLC may read from the stream until the next media replaces it
+        self._stream = stream
+        
+        # Write to a partial file so an interrupted download is never replayed
+        partial_path = file_path.with_suffix(".part")
+        started = False
+        try:
+            with open(partial_path, "wb") as audio_file:
+                for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                    stream.feed(chunk)
+                    audio_file.write(chunk)
+                    if not started and stream.buffered >= STREAM_START_BYTES:
+                        self._play()
+                        started = True
+        finally:
+            stream.finish()
+        partial_path.replace(file_path)
+        
+        # Short responses may never reach the start threshold
+        if not started:
+            self._play()
+        
+        self._playback_finished.wait(timeout=self._playback_timeout(file_path, text))
+    
+    def _speech_file_path(self, text: str) -> Path:
+        """
+        Get the file the speech for a text is stored in.
+        
+        Args:
+            text: The text to convert to speech
+        
+        Returns:
+            The cache file for the text and current voice settings, or a new
+            temporary file if caching is disabled
+        """
+        if self.cache_dir is None:
+            timestamp = int(time.time())
+            return Path(self.temp_dir) / f"speech_{timestamp}.{self.output_format}"
+        
+        key = hashlib.blake2b(
+            f"{self.model}|{self.voice}|{self.instructions}|{text}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return self.cache_dir / f"{key}.{self.output_format}"
+    
+    def _evict_cache(self) -> None:
+        """Delete the least recently played files while the cache is over its size limit."""
+        if self.cache_dir is None:
+            return
+        
+        try:
+            files = [(entry.stat(), entry.path) for entry in os.scandir(self.cache_dir) if entry.is_file()]
+            total = sum(stat.st_size for stat, _ in files)
+            
+            # Played files are touched, so the modification time orders them by use
+            for stat, path in sorted(files, key=lambda item: item[0].st_mtime):
+                if total <= self.cache_max_bytes:
+                    break
+                os.remove(path)
+                total -= stat.st_size
+        except OSError as e:
+            self.logger.error(f"Error evicting TTS cache: {e}")
+    
+    def _set_media(self, media) -> bool:
+        """
+        Load new media into the shared player, releasing the previous one.
+        
+        Args:
+            media: The VLC media to play next
+        
+        Returns:
+            False if the engine has been shut down and nothing was loaded
+        """
+        with self._player_lock:
+            if self._stopped:
+                media.release()
+                return False
+            
+            self._media_player.stop()
+            if self._media is not None:
+                self._media.release()
+            
+            self._media = media
+            self._media_player.set_media(media)
+            self._playback_finished.clear()
+            return True
+    
+    def _play(self) -> None:
+        """Start playing the loaded media, unless the engine has been shut down."""
+        with self._player_lock:
+            if not self._stopped:
+                self._media_player.play()
+    
+    def _play_audio(self, file_path: Path, text: str = "") -> None:
         """
         Play an audio file.
         
         Args:
             file_path: Path to the audio file
+            text: The spoken text, used to estimate the duration if it can't be read
         """
         try:
             if VLC_AVAILABLE and self.player:
                 # Use VLC for playback
-                media = self.player.media_new(str(file_path))
-                player = self.player.media_player_new()
-                player.set_media(media)
-                player.play()
+                if not self._set_media(self.player.media_new(str(file_path))):
+                    return
+                self._play()
                 
                 # Wait for playback to complete
-                # This is a simple implementation; a more robust one would use events
-                time.sleep(0.5)  # Give it time to start
-                while player.is_playing():
-                    time.sleep(0.1)
+                self._playback_finished.wait(timeout=self._playback_timeout(file_path, text))
             else:
                 # Fallback to system default player
                 if os.name == 'posix':  # macOS or Linux
-                    os.system(f"open {file_path}")
+                    os.system(f'open "{file_path}"')
                 elif os.name == 'nt':  # Windows
-                    os.system(f"start {file_path}")
+                    os.system(f'start "" "{file_path}"')  # The first quoted argument is the window title
                 
-                # Crude estimation of audio length: ~1 second per 15 characters
-                estimated_duration = len(str(file_path)) / 15
-                time.sleep(estimated_duration)
+                time.sleep(self._audio_duration(file_path, text))
         
         except Exception as e:
             self.logger.error(f"Error playing audio: {e}")
     
+    def _audio_duration(self, file_path: Path, text: str) -> float:
+        """
+        Get the playing time of an audio file.
+        
+        Args:
+            file_path: Path to the audio file
+            text: The spoken text
+        
+        Returns:
+            The duration in seconds
+        """
+        if MUTAGEN_AVAILABLE:
+            try:
+                audio = mutagen.File(str(file_path))
+            except mutagen.MutagenError:
+                audio = None
+            if audio is not None:
+                return audio.info.length
+        
+        # Crude estimation of audio length: ~1 second per 15 characters
+        return len(text) / 15
+    
+    def _playback_timeout(self, file_path: Path, text: str) -> float:
+        """
+        Get the longest time to wait for an audio file to finish playing.
+        
+        Args:
+            file_path: Path to the audio file
+            text: The spoken text
+        
+        Returns:
+            The timeout in seconds, half again the duration plus a margin
+            since it may only be estimated
+        """
+        return self._audio_duration(file_path, text) * 1.5 + PLAYBACK_MARGIN
+    
     def shutdown(self) -> None:
         """Release resources and shutdown the TTS engine."""
         self.logger.info("Shutting down TTS engine")
         
+        # Release the player and its media. The TTS worker isn't joined, so the lock
+        # keeps it from touching them afterwards.
+        with self._player_lock:
+            self._stopped = True
+            
+            # Wake up a playback wait; stop() doesn't fire EndReached or EncounteredError
+            self._playback_finished.set()
+            
+            if self._media_player is not None:
+                self._media_player.stop()
+                self._media_player.release()
+            if self._media is not None:
+                self._media.release()
+                self._media = None
+        
+        # Close pooled connections; a shared client is closed by its owner
+        if self._http is not None:
+            self._http.close()
+        
         # Clean up temporary files
         try:
             import shutil
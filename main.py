@@ -6,62 +6,260 @@ The main entry point for the Summer AI assistant.
 
 import os
 import sys
+import atexit
+import glob
+import json
 import logging
-import yaml
-from dotenv import load_dotenv
+import logging.handlers
+import pickle
+import queue
+import threading
+import urllib.request
 
-# Add the project root to the path to allow imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.config import SummerConfig
 
-# Import core components
-from core.assistant import Assistant
+# The log format doesn't use thread or process details, so don't collect them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Directory containing this file; running main.py already puts it on
+# sys.path, which is all the core and apps imports need
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Windows priority class for SetPriorityClass
+ABOVE_NORMAL_PRIORITY_CLASS = 0x8000
+
+# Welcome message shown at startup
+BANNER = (
+    "\n" + "=" * 50 + "\n"
+    "  Summer AI Assistant v{version}\n"
+    "  Your personal Windows AI assistant\n"
+    + "=" * 50 + "\n"
+    "  Say 'Hello Summer' to begin\n"
+    "  Press Ctrl+C to exit\n"
+    + "=" * 50 + "\n\n"
+)
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that buffers records instead of flushing after each one.
+    
+    The file is flushed right away for errors, every flush_interval seconds,
+    and when the handler is closed.
+    """
+    
+    def __init__(self, filename, flush_interval=30.0, buffer_size=65536):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._stop_flushing = threading.Event()
+        super().__init__(filename)
+        
+        threading.Thread(target=self._flush_periodically, name="summer-log-flush", daemon=True).start()
+    
+    def _open(self):
+        """Open the log file with a larger write buffer."""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        """Write a record, flushing only for errors."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        """Stop the periodic flush and close the file."""
+        self._stop_flushing.set()
+        super().close()
+    
+    def _flush_periodically(self):
+        """Flush the file every flush_interval seconds until closed."""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
 
 def setup_logging():
-    """Configure the logging system."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('summer.log')
-        ]
-    )
+    """
+    Configure the logging system.
+    
+    Log calls only put records on a queue; a background listener thread
+    does the console and file writes.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    formatter.default_msec_format = None  # Whole-second timestamps
+    # Records go to summer.log, or to the local syslog daemon if requested
+    if os.getenv("SUMMER_LOG_SYSLOG", "0") == "1":
+        address = "/dev/log" if os.path.exists("/dev/log") else ("localhost", 514)
+        log_handler = logging.handlers.SysLogHandler(address=address)
+    else:
+        log_handler = BufferedFileHandler('summer.log')
+    
+    handlers = [
+        logging.StreamHandler(),
+        log_handler
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # The queued record carries just the message; the listener's handlers format it
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    
+    # Stopping the listener at exit writes out any records still queued
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+def raise_process_priority():
+    """Run the assistant above normal priority, so audio capture isn't starved."""
+    try:
+        if os.name == 'nt':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), ABOVE_NORMAL_PRIORITY_CLASS)
+        elif hasattr(os, "nice"):
+            os.nice(-5)
+    except (OSError, AttributeError) as e:
+        # Unprivileged launches just keep the normal priority
+        logging.getLogger("summer").debug("Could not raise process priority: %s", e)
 
 def load_config():
     """Load configuration from the config.yml file."""
-    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yml")
+    config_path = os.path.join(_HERE, "config.yml")
     
     try:
+        # The parsed config is cached next to the file, keyed by its modification time
+        config_mtime = os.stat(config_path).st_mtime_ns
+        cache_path = f"{config_path}.{config_mtime}.pkl"
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                return pickle.load(cache_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+        
+        # Next best is a config.json compiled by tools/compile_config.py,
+        # as long as it isn't older than config.yml
+        json_path = os.path.join(_HERE, "config.json")
+        try:
+            if os.stat(json_path).st_mtime_ns >= config_mtime:
+                with open(json_path, 'r', encoding='utf-8') as json_file:
+                    config = json.load(json_file)
+                _write_config_cache(config_path, cache_path, config)
+                return config
+        except (OSError, ValueError):
+            pass
+        
+        # PyYAML is only imported when the YAML actually has to be parsed;
+        # use the libyaml-backed C loader when PyYAML was built with it
+        import yaml
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader
+        
         with open(config_path, 'r') as config_file:
-            config = yaml.safe_load(config_file)
+            config = yaml.load(config_file, Loader=Loader)
+        _write_config_cache(config_path, cache_path, config)
         return config
     except Exception as e:
         print(f"Error loading configuration: {e}")
         return {}
 
+def _write_config_cache(config_path, cache_path, config):
+    """Save the parsed config for the next launch and remove outdated caches."""
+    try:
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump(config, cache_file, protocol=5)
+        os.replace(temp_path, cache_path)
+        
+        for stale_path in glob.glob(glob.escape(config_path) + ".*.pkl"):
+            if stale_path != cache_path:
+                os.remove(stale_path)
+    except OSError:
+        # A read-only install just parses the YAML every time
+        pass
+
+def load_config_swr():
+    """
+    Load the configuration together with cached remote metadata.
+    
+    If the config declares a remote_metadata_url, the metadata saved by the
+    previous launch is added under "remote_metadata" right away, and a
+    background thread fetches a fresh copy for the next launch.
+    """
+    config = load_config()
+    url = config.get("remote_metadata_url")
+    if not url:
+        return config
+    
+    cache_path = os.path.join(os.path.expanduser("~"), ".cache", "summer", "meta.json")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as cache_file:
+            config["remote_metadata"] = json.load(cache_file)
+    except (OSError, ValueError):
+        config["remote_metadata"] = {}
+    
+    threading.Thread(target=_refresh_metadata, args=(url, cache_path),
+                     name="summer-metadata", daemon=True).start()
+    return config
+
+def _refresh_metadata(url, cache_path):
+    """Fetch the remote metadata and atomically replace the cached copy."""
+    logger = logging.getLogger("summer")
+    try:
+        with urllib.request.urlopen(url, timeout=10) as response:
+            metadata = json.load(response)
+        if not isinstance(metadata, dict):
+            raise ValueError("metadata is not a JSON object")
+        
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(metadata, cache_file)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        # The cached copy stays in use; the next launch tries again
+        logger.warning("Could not refresh remote metadata: %s", e)
+
 def main():
     """Main entry point for the Summer assistant."""
-    # Load environment variables from .env file
-    load_dotenv()
+    # Load environment variables from the .env file, if there is one;
+    # deployments that set them directly never import dotenv
+    env_path = os.path.join(_HERE, ".env")
+    if os.path.isfile(env_path):
+        from dotenv import load_dotenv
+        load_dotenv(env_path, override=False)
     
     # Setup logging
     setup_logging()
+    
+    # Respond to the wake phrase sooner, where the OS allows it
+    raise_process_priority()
     logger = logging.getLogger("summer")
     logger.info("Starting Summer AI Assistant")
     
     try:
         # Load configuration
-        config = load_config()
+        config = load_config_swr()
         logger.info("Configuration loaded successfully")
         
-        # Print a welcome message
-        print("\n" + "=" * 50)
-        print(f"  Summer AI Assistant v{config.get('assistant', {}).get('version', '0.1.0')}")
-        print("  Your personal Windows AI assistant")
-        print("=" * 50)
-        print("  Say 'Hello Summer' to begin")
-        print("  Press Ctrl+C to exit")
-        print("=" * 50 + "\n")
+        # Print a welcome message in a single write
+        sys.stdout.write(BANNER.format(version=SummerConfig.from_dict(config).version))
+        sys.stdout.flush()
+        
+        # Import the assistant only now, so the banner shows before its
+        # dependency tree is loaded
+        from core.assistant import Assistant
         
         # Initialize the assistant with the loaded configuration
         assistant = Assistant(config)
@@ -0,0 +1,35 @@
+"""
+Summer AI Assistant - Config Compiler
+-----------------------------------
+Compiles config.yml into config.json, which loads faster at startup.
+
+Run this after installing or after editing config.yml:
+
+    python tools/compile_config.py
+"""
+
+import json
+import os
+import yaml
+
+# Project root, one level above this script
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def compile_config():
+    """Write config.json with the contents of config.yml."""
+    config_path = os.path.join(ROOT, "config.yml")
+    json_path = os.path.join(ROOT, "config.json")
+    
+    with open(config_path, 'r') as config_file:
+        config = yaml.safe_load(config_file)
+    
+    # Write to a temporary file first, so a partial config.json is never loaded
+    temp_path = f"{json_path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as json_file:
+        json.dump(config, json_file, indent=2)
+    os.replace(temp_path, json_path)
+    
+    print(f"Compiled {config_path} to {json_path}")
+
+if __name__ == "__main__":
+    compile_config()